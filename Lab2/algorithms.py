@@ -0,0 +1,87 @@
+import importlib
+
+
+class SortAlgorithm:
+    """Registry entry: where a sort lives, how to call it and what it guarantees.
+
+    The module is only imported the first time the sort is run.
+    """
+
+    def __init__(self, name, module, function, call="data", stable=False, in_place=True,
+                 best="", average="", worst="", space="", budgeted=False):
+        self.name = name
+        self.module = module
+        self.function = function
+        # "data" sorts take (data, drawData, speed), "range" sorts take (data, low, high, drawData, speed)
+        self.call = call
+        self.stable = stable
+        self.in_place = in_place
+        self.best = best
+        self.average = average
+        self.worst = worst
+        self.space = space
+        # Accepts a budget= WorkBudget, for sorts that can run unboundedly long
+        self.budgeted = budgeted
+        self._impl = None
+
+    def load(self):
+        if self._impl is None:
+            self._impl = getattr(importlib.import_module(self.module), self.function)
+        return self._impl
+
+    def run(self, data, drawData=None, speed=0, **options):
+        sort = self.load()
+        if self.call == "range":
+            sort(data, 0, len(data) - 1, drawData, speed, **options)
+        else:
+            sort(data, drawData, speed, **options)
+
+    def __repr__(self):
+        return f"SortAlgorithm({self.name!r}, {self.module}.{self.function})"
+
+
+REGISTRY = {}
+
+def register(name, module, function, **metadata):
+    REGISTRY[name] = SortAlgorithm(name, module, function, **metadata)
+    return REGISTRY[name]
+
+def get(name):
+    return REGISTRY[name]
+
+def names():
+    return list(REGISTRY)
+
+def find(**metadata):
+    # e.g. find(stable=True, in_place=True)
+    return [alg for alg in REGISTRY.values()
+            if all(getattr(alg, key) == value for key, value in metadata.items())]
+
+def run_sort(name, data, drawData=None, speed=0, **options):
+    REGISTRY[name].run(data, drawData, speed, **options)
+
+
+register("Bubble Sort", "bub_srt", "bubble", stable=True,
+         best="O(n^2)", average="O(n^2)", worst="O(n^2)", space="O(1)")
+register("Quick Sort", "quick_sort", "quicksort", call="range",
+         best="O(n log n)", average="O(n log n)", worst="O(n^2)", space="O(n)")
+register("Quick Sort Opt", "quick_sort_opt", "quicksort_optimized",
+         best="O(n log n)", average="O(n log n)", worst="O(n^2)", space="O(log n)")
+register("Merge Sort", "merge_sort", "merge_sort", call="range", stable=True, in_place=False,
+         best="O(n log n)", average="O(n log n)", worst="O(n log n)", space="O(n)")
+register("Merge Sort Opt", "merge_sort_opt", "merge_sort_optimized", stable=True,
+         best="O(n log n)", average="O(n^2)", worst="O(n^2)", space="O(1)")
+register("Heap Sort", "heap_sort", "heapSort",
+         best="O(n log n)", average="O(n log n)", worst="O(n log n)", space="O(log n)")
+register("Heap Sort Opt", "heap_sort_opt", "heap_sort_optimized",
+         best="O(n log n)", average="O(n log n)", worst="O(n log n)", space="O(1)")
+register("Kirkpatrick-Reisch Sort", "kirkpatrick_reisch_sort", "kirkpatrick_reisch_sort", in_place=False,
+         best="O(n log n)", average="O(n log n)", worst="O(n log n)", space="O(n)")
+register("Slow Sort", "slow_sort", "slow_sort", call="range", budgeted=True,
+         best="O(n^(log n / 2))", average="O(n^(log n / 2))", worst="O(n^(log n / 2))", space="O(n)")
+register("Bucket Sort", "bucket_sort", "bucket_sort", stable=True, in_place=False,
+         best="O(n)", average="O(n)", worst="O(n log n)", space="O(n)")
+register("Bucket Sort Opt", "bucket_sort_opt", "bucket_sort_optimized", stable=True, in_place=False,
+         best="O(n)", average="O(n)", worst="O(n^2)", space="O(n)")
+register("Bogo Sort", "bogo_sort", "bogoSort", budgeted=True,
+         best="O(n)", average="O(n * n!)", worst="unbounded", space="O(1)")
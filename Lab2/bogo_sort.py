@@ -1,11 +1,14 @@
 import random
 import time
 
-def bogoSort(data, drawData, timer):
+def bogoSort(data, drawData=None, timer=0, budget=None):
     while not is_sorted(data):
+        if budget:
+            budget.spend()
         shuffle(data)
-        drawData(data, ['Red' for _ in range(len(data))])
-        time.sleep(timer)
+        if drawData:
+            drawData(data, ['Red' for _ in range(len(data))])
+            time.sleep(timer)
 
 def is_sorted(data):
     for i in range(len(data) - 1):
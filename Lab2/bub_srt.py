@@ -1,6 +1,6 @@
 import time
 
-def bubble(data, drawData, timer):
+def bubble(data, drawData=None, timer=0):
 	n = len(data)
 	
 	for i in range(n):
@@ -10,9 +10,11 @@ def bubble(data, drawData, timer):
 				data[j], data[j+1] = data[j+1], data[j]
 				
 				# if swapped then color becomes Green else stays Red
-				drawData(data, ['Green' if x == j +
-								1 else 'Red' for x in range(len(data))])
-				time.sleep(timer)
+				if drawData:
+					drawData(data, ['Green' if x == j +
+									1 else 'Red' for x in range(len(data))])
+					time.sleep(timer)
 		
 	# sorted elements generated with Green color
-	drawData(data, ['Green' for x in range(len(data))])
+	if drawData:
+		drawData(data, ['Green' for x in range(len(data))])
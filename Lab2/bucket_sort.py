@@ -1,6 +1,6 @@
 import time
 
-def bucket_sort(arr, drawData, speed):
+def bucket_sort(arr, drawData=None, speed=0):
     if len(arr) == 0:
         return arr
 
@@ -13,15 +13,18 @@ def bucket_sort(arr, drawData, speed):
         index = int((num - min_value) / (max_value - min_value + 1) * (bucket_count - 1))
         buckets[index].append(num)
 
-    drawData(arr, ['Yellow' for _ in range(len(arr))])
-    time.sleep(speed)
+    if drawData:
+        drawData(arr, ['Yellow' for _ in range(len(arr))])
+        time.sleep(speed)
 
     sorted_arr = []
     for bucket in buckets:
         bucket.sort()
         sorted_arr.extend(bucket)
-        drawData(sorted_arr + [min(arr)] * (len(arr) - len(sorted_arr)), ['Green' for _ in range(len(arr))])
-        time.sleep(speed)
+        if drawData:
+            drawData(sorted_arr + [min(arr)] * (len(arr) - len(sorted_arr)), ['Green' for _ in range(len(arr))])
+            time.sleep(speed)
 
     arr[:] = sorted_arr
-    drawData(arr, ['Blue' for _ in range(len(arr))]) 
+    if drawData:
+        drawData(arr, ['Blue' for _ in range(len(arr))]) 
@@ -1,6 +1,6 @@
 import time
 
-def bucket_sort_optimized(arr, drawData, speed):
+def bucket_sort_optimized(arr, drawData=None, speed=0):
     if len(arr) == 0:
         return
 
@@ -15,8 +15,9 @@ def bucket_sort_optimized(arr, drawData, speed):
         index = min(index, bucket_count - 1)
         buckets[index].append(num)
 
-    drawData(arr, ['Yellow' for _ in range(len(arr))])
-    time.sleep(speed)
+    if drawData:
+        drawData(arr, ['Yellow' for _ in range(len(arr))])
+        time.sleep(speed)
 
     sorted_index = 0
     for bucket in buckets:
@@ -24,10 +25,12 @@ def bucket_sort_optimized(arr, drawData, speed):
         for num in bucket:
             arr[sorted_index] = num
             sorted_index += 1
-            drawData(arr, ['Green' if x <= sorted_index else 'Red' for x in range(len(arr))])
-            time.sleep(speed)
+            if drawData:
+                drawData(arr, ['Green' if x <= sorted_index else 'Red' for x in range(len(arr))])
+                time.sleep(speed)
 
-    drawData(arr, ['Blue' for _ in range(len(arr))]) 
+    if drawData:
+        drawData(arr, ['Blue' for _ in range(len(arr))]) 
 
 def insertion_sort(bucket):
     """Efficient Insertion Sort for small bucket arrays."""
@@ -0,0 +1,115 @@
+import math
+import sys
+import time
+from collections import Counter
+from functools import lru_cache
+
+
+class BudgetExceeded(Exception):
+    pass
+
+
+class WorkBudget:
+    """Caps the work a sort may do, by operation count, wall time or cancel()."""
+
+    def __init__(self, max_ops=None, max_seconds=None):
+        self.max_ops = max_ops
+        self.max_seconds = max_seconds
+        self.ops = 0
+        self.cancelled = False
+        self.start = time.perf_counter()
+
+    def spend(self, ops=1):
+        if self.cancelled:
+            raise BudgetExceeded("cancelled")
+        if self.max_ops is not None and self.ops + ops > self.max_ops:
+            raise BudgetExceeded(f"operation budget of {self.max_ops} exhausted")
+        if self.max_seconds is not None and self.elapsed() > self.max_seconds:
+            raise BudgetExceeded(f"time budget of {self.max_seconds}s exhausted")
+        self.ops += ops
+
+    def cancel(self):
+        self.cancelled = True
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+
+class BudgetResult:
+    def __init__(self, algorithm, n, completed, ops, elapsed, expected_ops, sortedness, reason=""):
+        self.algorithm = algorithm
+        self.n = n
+        self.completed = completed
+        self.ops = ops
+        self.elapsed = elapsed
+        self.expected_ops = expected_ops
+        self.sortedness = sortedness
+        self.reason = reason
+
+    def progress(self):
+        if self.completed:
+            return 1.0
+        return min(1.0, self.ops / self.expected_ops) if self.expected_ops else 0.0
+
+    def __repr__(self):
+        state = "completed" if self.completed else f"stopped ({self.reason})"
+        return (f"BudgetResult({self.algorithm!r}, n={self.n}, {state}, ops={self.ops}, "
+                f"expected_ops={format_count(self.expected_ops)}, sortedness={self.sortedness:.2f})")
+
+
+def format_count(count):
+    # Bogo Sort counts are exact factorials, past n = 170 they no longer fit in a float
+    if count > sys.float_info.max:
+        return f"~10^{len(str(count)) - 1}"
+    return f"{count:.3g}"
+
+
+@lru_cache(maxsize=None)
+def slow_sort_calls(n):
+    # Calls made by slow_sort on n elements: T(n) = 1 + T(ceil(n/2)) + T(floor(n/2)) + T(n-1)
+    if n <= 1:
+        return 1
+    return 1 + slow_sort_calls((n + 1) // 2) + slow_sort_calls(n // 2) + slow_sort_calls(n - 1)
+
+def bogo_sort_shuffles(data):
+    # Each shuffle succeeds with probability 1 / (number of distinct orderings)
+    orderings = math.factorial(len(data))
+    for count in Counter(data).values():
+        orderings //= math.factorial(count)
+    return orderings
+
+def expected_ops(algorithm, data):
+    if algorithm == "Bogo Sort":
+        return bogo_sort_shuffles(data)
+    if algorithm == "Slow Sort":
+        for n in range(2, len(data), 64):
+            slow_sort_calls(n)  # warm the cache bottom up to keep the recursion shallow
+        return slow_sort_calls(len(data))
+    raise ValueError(f"No cost model for {algorithm}")
+
+def sortedness(data):
+    # Fraction of neighbouring pairs already in order
+    if len(data) < 2:
+        return 1.0
+    return sum(data[i] <= data[i + 1] for i in range(len(data) - 1)) / (len(data) - 1)
+
+def run_budgeted(algorithm, data, max_ops=None, max_seconds=None, drawData=None, speed=0):
+    """Run Bogo Sort or Slow Sort in place under a work budget without raising."""
+    from algorithms import run_sort
+    budget = WorkBudget(max_ops, max_seconds)
+    expected = expected_ops(algorithm, data)
+    try:
+        run_sort(algorithm, data, drawData, speed, budget=budget)
+        completed, reason = True, ""
+    except BudgetExceeded as error:
+        completed, reason = False, str(error)
+    return BudgetResult(algorithm, len(data), completed, budget.ops, budget.elapsed(),
+                        expected, sortedness(data), reason)
+
+if __name__ == "__main__":
+    import random
+
+    # Sizes up to the GUI slider maximum, including factorials too large for a float
+    for n in (8, 170, 171, 1000):
+        print(run_budgeted("Bogo Sort", random.sample(range(1000), n), max_ops=100))
+    print(run_budgeted("Slow Sort", random.sample(range(1000), 200), max_seconds=0.1))
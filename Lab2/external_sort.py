@@ -0,0 +1,137 @@
+import heapq
+import os
+import shutil
+import tempfile
+from array import array
+from algorithms import run_sort
+
+
+def external_sort(input_path, output_path, chunk_size=1_000_000, binary=False, typecode='i',
+                  sort_chunk=None, fan_in=64, buffer_size=1 << 16, tmp_dir=None):
+    """Sort a file of numbers that does not fit in memory.
+
+    Chunks of at most chunk_size numbers are sorted in memory and spilled to
+    run files, which are then k-way merged through a heap, fan_in at a time.
+    Binary files hold raw values of the given array typecode.  sort_chunk is
+    the registry name of a Lab2 sort (or a function sorting a list in place);
+    the default is the built-in sorted.
+    """
+    work_dir = tempfile.mkdtemp(prefix="extsort_", dir=tmp_dir)
+    try:
+        runs = write_sorted_runs(input_path, work_dir, chunk_size, binary, typecode, sort_chunk)
+
+        # Each reader gets an equal share of the memory budget
+        run_buffer = max(1024, chunk_size // (fan_in + 1))
+        generation = 0
+        while len(runs) > fan_in:
+            merged_runs = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                path = os.path.join(work_dir, f"merge_{generation}_{i // fan_in}.bin")
+                with open(path, 'wb') as out:
+                    kway_merge(group, typecode, run_buffer, lambda block: block.tofile(out))
+                for run in group:
+                    os.remove(run)
+                merged_runs.append(path)
+            runs = merged_runs
+            generation += 1
+
+        with open(output_path, 'wb' if binary else 'w') as out:
+            if binary:
+                write_block = lambda block: block.tofile(out)
+            else:
+                write_block = lambda block: out.write('\n'.join(map(repr, block)) + '\n')
+            kway_merge(runs, typecode, run_buffer, write_block, buffer_size)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def write_sorted_runs(input_path, work_dir, chunk_size, binary, typecode, sort_chunk=None):
+    runs = []
+    reader = read_binary_chunks if binary else read_text_chunks
+    for chunk in reader(input_path, chunk_size, typecode):
+        # The Lab2 sorts expect a list, some of them assign list slices back
+        values = chunk.tolist()
+        if sort_chunk is None:
+            values.sort()
+        elif isinstance(sort_chunk, str):
+            run_sort(sort_chunk, values)
+        else:
+            sort_chunk(values)
+        chunk = array(typecode, values)
+
+        path = os.path.join(work_dir, f"run_{len(runs)}.bin")
+        with open(path, 'wb') as f:
+            chunk.tofile(f)
+        runs.append(path)
+    return runs
+
+
+def read_binary_chunks(path, chunk_size, typecode):
+    with open(path, 'rb') as f:
+        while True:
+            chunk = array(typecode)
+            try:
+                chunk.fromfile(f, chunk_size)
+            except EOFError:
+                # fromfile keeps the items that were available before the end
+                if chunk:
+                    yield chunk
+                return
+            yield chunk
+
+
+def read_text_chunks(path, chunk_size, typecode):
+    parse = float if typecode in 'fd' else int
+    chunk = array(typecode)
+    with open(path, 'r') as f:
+        for line in f:
+            for token in line.split():
+                chunk.append(parse(token))
+                if len(chunk) == chunk_size:
+                    yield chunk
+                    chunk = array(typecode)
+    if chunk:
+        yield chunk
+
+
+def read_run(path, typecode, buffer_size):
+    with open(path, 'rb') as f:
+        while True:
+            block = array(typecode)
+            try:
+                block.fromfile(f, buffer_size)
+            except EOFError:
+                yield from block
+                return
+            yield from block
+
+
+def kway_merge(runs, typecode, run_buffer, write_block, buffer_size=1 << 16):
+    # The Lab2 merges work on two in-memory lists; runs are streamed from disk
+    # and merged fan_in at a time, so a heap picks the next value instead
+    readers = [read_run(path, typecode, run_buffer) for path in runs]
+
+    heap = []
+    for index, reader in enumerate(readers):
+        first = next(reader, None)
+        if first is not None:
+            heap.append((first, index))
+    heapq.heapify(heap)
+
+    out = array(typecode)
+    while heap:
+        value, index = heap[0]
+        out.append(value)
+        if len(out) >= buffer_size:
+            write_block(out)
+            out = array(typecode)
+
+        following = next(readers[index], None)
+        if following is None:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (following, index))
+
+    if out:
+        write_block(out)
@@ -1,6 +1,6 @@
 import time
 
-def heapify(arr, n, i, drawData, speed):
+def heapify(arr, n, i, drawData=None, speed=0):
     largest = i  
     l = 2 * i + 1  
     r = 2 * i + 2  
@@ -14,12 +14,13 @@ def heapify(arr, n, i, drawData, speed):
     if largest != i:
         arr[i], arr[largest] = arr[largest], arr[i]
 
-        drawData(arr, ['Green' if x == i or x == largest else 'Red' for x in range(len(arr))])
-        time.sleep(speed)
+        if drawData:
+            drawData(arr, ['Green' if x == i or x == largest else 'Red' for x in range(len(arr))])
+            time.sleep(speed)
 
         heapify(arr, n, largest, drawData, speed)
 
-def heapSort(arr, drawData, speed):
+def heapSort(arr, drawData=None, speed=0):
     n = len(arr)
 
     for i in range(n // 2 - 1, -1, -1):
@@ -28,9 +29,11 @@ def heapSort(arr, drawData, speed):
     for i in range(n - 1, 0, -1):
         arr[0], arr[i] = arr[i], arr[0]  
 
-        drawData(arr, ['Green' if x == i else 'Red' for x in range(len(arr))])
-        time.sleep(speed)
+        if drawData:
+            drawData(arr, ['Green' if x == i else 'Red' for x in range(len(arr))])
+            time.sleep(speed)
 
         heapify(arr, i, 0, drawData, speed)
 
-    drawData(arr, ['Blue' for _ in range(len(arr))])  
+    if drawData:
+        drawData(arr, ['Blue' for _ in range(len(arr))])  
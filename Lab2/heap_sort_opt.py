@@ -1,6 +1,6 @@
 import time
 
-def heap_sort_optimized(arr, drawData, speed):
+def heap_sort_optimized(arr, drawData=None, speed=0):
 
     n = len(arr)
 
@@ -9,14 +9,16 @@ def heap_sort_optimized(arr, drawData, speed):
 
     for i in range(n - 1, 0, -1):
         arr[i], arr[0] = arr[0], arr[i] 
-        drawData(arr, ['Green' if x == i else 'Red' for x in range(len(arr))])
-        time.sleep(speed)
+        if drawData:
+            drawData(arr, ['Green' if x == i else 'Red' for x in range(len(arr))])
+            time.sleep(speed)
 
         heapify(arr, i, 0, drawData, speed)
 
-    drawData(arr, ['Blue' for _ in range(len(arr))])
+    if drawData:
+        drawData(arr, ['Blue' for _ in range(len(arr))])
 
-def heapify(arr, n, i, drawData, speed):
+def heapify(arr, n, i, drawData=None, speed=0):
 
     while True:
         largest = i
@@ -32,7 +34,8 @@ def heapify(arr, n, i, drawData, speed):
             break
 
         arr[i], arr[largest] = arr[largest], arr[i]
-        drawData(arr, ['Green' if x == i or x == largest else 'Red' for x in range(len(arr))])
-        time.sleep(speed)
+        if drawData:
+            drawData(arr, ['Green' if x == i or x == largest else 'Red' for x in range(len(arr))])
+            time.sleep(speed)
 
         i = largest 
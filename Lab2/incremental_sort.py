@@ -0,0 +1,163 @@
+from bisect import bisect_left, bisect_right, insort
+from math import isqrt
+from bucket_sort_opt import insertion_sort
+from kirkpatrick_reisch_sort import kirkpatrick_reisch_sort, merge
+
+
+class IncrementalSortedList:
+    """Sorted container for data that arrives in small batches.
+
+    New values go into a small sorted buffer and removed values into a
+    sorted tombstone list.  Once either grows past the threshold (about
+    sqrt(n) by default) they are merged into the sorted backing list in one
+    linear pass, so maintenance is amortized O(sqrt n) per change while
+    lookups stay O(log n) binary searches over the three lists and indexing
+    is O(log^2 n).
+    """
+
+    def __init__(self, values=(), threshold=None):
+        self.values = list(values)
+        kirkpatrick_reisch_sort(self.values)
+        self.buffer = []
+        self.removed = []
+        self.threshold = threshold
+
+    def flush_size(self):
+        if self.threshold is not None:
+            return self.threshold
+        return max(32, isqrt(len(self.values)))
+
+    def append(self, value):
+        insort(self.buffer, value)
+        self.maybe_flush()
+
+    def extend(self, values):
+        batch = list(values)
+        if len(batch) <= 32:
+            insertion_sort(batch)
+        else:
+            kirkpatrick_reisch_sort(batch)
+        self.buffer = merge(self.buffer, batch)
+        self.maybe_flush()
+
+    def remove(self, value):
+        i = bisect_left(self.buffer, value)
+        if i < len(self.buffer) and self.buffer[i] == value:
+            del self.buffer[i]
+            return
+
+        in_values = bisect_right(self.values, value) - bisect_left(self.values, value)
+        in_removed = bisect_right(self.removed, value) - bisect_left(self.removed, value)
+        if in_values <= in_removed:
+            raise ValueError(f"{value!r} is not in the list")
+        insort(self.removed, value)
+        self.maybe_flush()
+
+    def update(self, old, new):
+        self.remove(old)
+        self.append(new)
+
+    def update_at(self, index, new):
+        self.update(self[index], new)
+
+    def maybe_flush(self):
+        if len(self.buffer) + len(self.removed) > self.flush_size():
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.values = merge(self.values, self.buffer)
+            self.buffer = []
+        if self.removed:
+            # Both lists are sorted, so the tombstones can be dropped in one pass
+            kept = []
+            j = 0
+            for value in self.values:
+                if j < len(self.removed) and value == self.removed[j]:
+                    j += 1
+                else:
+                    kept.append(value)
+            self.values = kept
+            self.removed = []
+
+    def count(self, value):
+        return sum(bisect_right(part, value) - bisect_left(part, value)
+                   for part in (self.values, self.buffer)) - \
+               (bisect_right(self.removed, value) - bisect_left(self.removed, value))
+
+    def rank(self, value):
+        # Number of stored values smaller than value
+        return bisect_left(self.values, value) + bisect_left(self.buffer, value) - bisect_left(self.removed, value)
+
+    def __contains__(self, value):
+        return self.count(value) > 0
+
+    def __len__(self):
+        return len(self.values) + len(self.buffer) - len(self.removed)
+
+    def count_at_most(self, value):
+        # Number of stored values less than or equal to value
+        return bisect_right(self.values, value) + bisect_right(self.buffer, value) - bisect_right(self.removed, value)
+
+    def first_reaching(self, part, index):
+        # Smallest value of part with more than index stored values at or below it
+        low, high = 0, len(part)
+        while low < high:
+            mid = (low + high) // 2
+            if self.count_at_most(part[mid]) > index:
+                high = mid
+            else:
+                low = mid + 1
+        return part[low] if low < len(part) else None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("list index out of range")
+        if not self.buffer and not self.removed:
+            return self.values[index]
+
+        # The index-th value is stored in values or in buffer, so it is the
+        # smaller of the first value reaching the index in either list
+        candidates = [value for value in (self.first_reaching(self.values, index),
+                                          self.first_reaching(self.buffer, index)) if value is not None]
+        return min(candidates)
+
+    def __iter__(self):
+        if self.buffer or self.removed:
+            self.flush()
+        return iter(self.values)
+
+    def __repr__(self):
+        return f"IncrementalSortedList({list(self)!r})"
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    from heap_sort_opt import heap_sort_optimized
+
+    data = [random.randint(0, 10 ** 6) for _ in range(5000)]
+    batches = [[random.randint(0, 10 ** 6) for _ in range(10)] for _ in range(100)]
+
+    start = time.perf_counter()
+    resorted = data[:]
+    for batch in batches:
+        resorted.extend(batch)
+        heap_sort_optimized(resorted)
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    incremental = IncrementalSortedList(data)
+    for batch in batches:
+        incremental.extend(batch)
+        incremental.rank(batch[0])
+    incremental_time = time.perf_counter() - start
+
+    assert list(incremental) == resorted
+    print(f"Re-sort after every batch: {full_time:.3f} s")
+    print(f"Incremental container:     {incremental_time:.3f} s")
@@ -0,0 +1,147 @@
+import sys
+import tracemalloc
+import algorithms
+from algorithms import run_sort
+
+
+class SortStats:
+    """Machine independent operation counts for one sorting run."""
+
+    FIELDS = ("comparisons", "swaps", "writes", "slice_copies", "max_depth", "peak_memory")
+
+    def __init__(self, algorithm, n):
+        self.algorithm = algorithm
+        self.n = n
+        self.comparisons = 0
+        self.swaps = 0
+        self.writes = 0
+        self.slice_copies = 0
+        self.max_depth = 0
+        self.peak_memory = 0
+        self.sorted = False
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in ("algorithm", "n") + self.FIELDS}
+
+    def __repr__(self):
+        counts = ", ".join(f"{field}={getattr(self, field)}" for field in self.FIELDS)
+        return f"SortStats({self.algorithm!r}, n={self.n}, {counts})"
+
+
+def counted_type(base, stats):
+    # Elements count their own comparisons; arithmetic still returns plain numbers
+    class Counted(base):
+        __slots__ = ()
+
+        def __lt__(self, other):
+            stats.comparisons += 1
+            return base.__lt__(self, other)
+
+        def __le__(self, other):
+            stats.comparisons += 1
+            return base.__le__(self, other)
+
+        def __gt__(self, other):
+            stats.comparisons += 1
+            return base.__gt__(self, other)
+
+        def __ge__(self, other):
+            stats.comparisons += 1
+            return base.__ge__(self, other)
+
+        __hash__ = base.__hash__
+
+    return Counted
+
+
+class TrackedList(list):
+    """List that counts element writes, swaps and slice copies."""
+
+    def __init__(self, values, stats):
+        super().__init__(values)
+        self.stats = stats
+        self._last_write = None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            part = list.__getitem__(self, index)
+            self.stats.slice_copies += len(part)
+            return part
+        return list.__getitem__(self, index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            list.__setitem__(self, index, value)
+            self.stats.writes += len(value)
+            self._last_write = None
+            return
+
+        old = list.__getitem__(self, index)
+        list.__setitem__(self, index, value)
+        self.stats.writes += 1
+
+        # a[i], a[j] = a[j], a[i] shows up as two writes exchanging the same objects
+        last = self._last_write
+        if last is not None and last[0] != index and value is last[1] and old is last[2]:
+            self.stats.swaps += 1
+            self._last_write = None
+        else:
+            self._last_write = (index, old, value)
+
+
+def depth_profiler(stats):
+    ignored = {__file__, algorithms.__file__}
+    active = {}
+
+    def profile(frame, event, arg):
+        code = frame.f_code
+        if code.co_filename in ignored:
+            return
+        if event == 'call':
+            active[code] = active.get(code, 0) + 1
+            if active[code] > stats.max_depth:
+                stats.max_depth = active[code]
+        elif event == 'return':
+            active[code] -= 1
+
+    return profile
+
+def measure(algorithm, data):
+    """Run a Lab2 sort on a copy of data and return its SortStats."""
+    stats = SortStats(algorithm, len(data))
+    base = float if any(isinstance(x, float) for x in data) else int
+    Counted = counted_type(base, stats)
+    tracked = TrackedList((Counted(x) for x in data), stats)
+    # Import the module now so the import is not measured
+    algorithms.get(algorithm).load()
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    sys.setprofile(depth_profiler(stats))
+    try:
+        run_sort(algorithm, tracked)
+    finally:
+        sys.setprofile(None)
+        stats.peak_memory = tracemalloc.get_traced_memory()[1] - baseline
+        tracemalloc.stop()
+
+    stats.sorted = list(tracked) == sorted(data)
+    return stats
+
+def compare(data, names=None):
+    results = []
+    for name in names or algorithms.names():
+        if name == "Bogo Sort" and len(data) > 8:
+            continue
+        results.append(measure(name, data))
+
+    print(f"{'Algorithm':<25}" + "".join(f"{field:>14}" for field in SortStats.FIELDS))
+    for stats in results:
+        print(f"{stats.algorithm:<25}" + "".join(f"{getattr(stats, field):>14}" for field in SortStats.FIELDS))
+    return results
+
+if __name__ == "__main__":
+    import random
+    compare([random.randint(0, 100) for _ in range(60)])
@@ -1,6 +1,6 @@
 import time
 
-def kirkpatrick_reisch_sort(arr, drawData, speed):
+def kirkpatrick_reisch_sort(arr, drawData=None, speed=0):
     n = len(arr)
     if n <= 1:
         return arr
@@ -13,13 +13,15 @@ def kirkpatrick_reisch_sort(arr, drawData, speed):
             right = arr[i + step:i + 2 * step]
             merged += merge(left, right, drawData, speed)
         arr[:] = merged
-        drawData(arr, ['Green' if x < step else 'Red' for x in range(len(arr))])
-        time.sleep(speed)
+        if drawData:
+            drawData(arr, ['Green' if x < step else 'Red' for x in range(len(arr))])
+            time.sleep(speed)
         step *= 2
     
-    drawData(arr, ['Blue' for _ in range(len(arr))])  # Final sorted state
+    if drawData:
+        drawData(arr, ['Blue' for _ in range(len(arr))])  # Final sorted state
 
-def merge(left, right, drawData, speed):
+def merge(left, right, drawData=None, speed=0):
     merged = []
     i = j = 0
 
@@ -30,8 +32,9 @@ def merge(left, right, drawData, speed):
         else:
             merged.append(right[j])
             j += 1
-        drawData(merged + left[i:] + right[j:], ['Yellow' for _ in range(len(merged + left[i:] + right[j:]))])
-        time.sleep(speed)
+        if drawData:
+            drawData(merged + left[i:] + right[j:], ['Yellow' for _ in range(len(merged + left[i:] + right[j:]))])
+            time.sleep(speed)
 
     merged.extend(left[i:])
     merged.extend(right[j:])
@@ -3,18 +3,8 @@ from tkinter import ttk
 from tkinter import messagebox
 import random
 import time
-from bub_srt import bubble
-from quick_sort import quicksort
-from merge_sort import merge_sort
-from heap_sort import heapSort
-from kirkpatrick_reisch_sort import kirkpatrick_reisch_sort
-from slow_sort import slow_sort
-from bucket_sort import bucket_sort
-from bogo_sort import bogoSort
-from quick_sort_opt import quicksort_optimized
-from merge_sort_opt import merge_sort_optimized
-from heap_sort_opt import heap_sort_optimized
-from bucket_sort_opt import bucket_sort_optimized
+from algorithms import get, names, run_sort
+from budget import BudgetExceeded, WorkBudget
 
 
 # Initialize root class for Tkinter
@@ -26,6 +16,7 @@ root.config(bg="Grey")
 select_alg = StringVar()
 data = []
 sorting = False 
+MAX_SORT_SECONDS = 60
 
 # Function to generate data values
 def generate():
@@ -45,9 +36,10 @@ def drawData(data, colorlist):
     can_width = 1870
     x_width = can_width / (len(data) + 1)
     offset = 30
-    spacing = 10
+    spacing = 10 if x_width > 20 else 0
     
-    normalized_data = [i / max(data) if max(data) > 0 else 1 for i in data]
+    max_value = max(data)
+    normalized_data = [i / max_value if max_value > 0 else 1 for i in data]
     
     for i, height in enumerate(normalized_data):
         x0 = i * x_width + offset + spacing
@@ -55,11 +47,41 @@ def drawData(data, colorlist):
         x1 = (i + 1) * x_width + offset
         y1 = can_height
         
-        canvas.create_rectangle(x0, y0, x1, y1, fill=colorlist[i])
-        canvas.create_text(x0 + 2, y0, anchor=SE, text=str(data[i]))
+        canvas.create_rectangle(x0, y0, x1, y1, fill=colorlist[i], width=1 if spacing else 0)
+        # Value labels only fit while the bars are wide enough
+        if x_width > 20:
+            canvas.create_text(x0 + 2, y0, anchor=SE, text=str(data[i]))
     
     root.update_idletasks()
 
+class FrameBudget:
+    """drawData wrapper that redraws at most max_fps times per second.
+
+    The sorts only build a color list, draw and sleep when drawData is
+    truthy, so between frames this object is falsy and the operations run
+    at full speed; the next frame shows everything that changed meanwhile.
+    The sorts are run with speed 0 and the wrapper sleeps delay after each
+    frame instead, so a slow speed setting spaces out frames rather than
+    forcing one per operation.
+    """
+
+    def __init__(self, draw, max_fps, delay=0):
+        self.draw = draw
+        self.interval = 1 / max_fps if max_fps > 0 else 0
+        self.delay = delay
+        self.last_frame = 0.0
+        self.frames = 0
+
+    def __bool__(self):
+        return time.perf_counter() - self.last_frame >= self.interval
+
+    def __call__(self, data, colorlist):
+        self.draw(data, colorlist)
+        self.frames += 1
+        time.sleep(self.delay)
+        # Measured after the delay, so the sleep never counts towards the frame interval
+        self.last_frame = time.perf_counter()
+
 # Function to start sorting
 def start_algorithm():
     global data, sorting
@@ -68,30 +90,20 @@ def start_algorithm():
 
     start_time = time.time()  # Record start time
 
-    if select_alg.get() == "Bubble Sort":
-        bubble(data, drawData, speed)
-    elif select_alg.get() == "Quick Sort":
-        quicksort(data, 0, len(data) - 1, drawData, speed)
-    elif select_alg.get() == "Quick Sort Opt":
-        quicksort_optimized(data, drawData, speed)
-    elif select_alg.get() == "Merge Sort":
-        merge_sort(data, 0, len(data) - 1, drawData, speed)
-    elif select_alg.get() == "Merge Sort Opt":
-        merge_sort_optimized(data, drawData, speed)
-    elif select_alg.get() == "Heap Sort":
-        heapSort(data, drawData, speed)
-    elif select_alg.get() == "Heap Sort Opt":
-        heap_sort_optimized(data, drawData, speed)
-    elif select_alg.get() == "Kirkpatrick-Reisch Sort":
-        kirkpatrick_reisch_sort(data, drawData, speed)
-    elif select_alg.get() == "Slow Sort":
-        slow_sort(data, 0, len(data) - 1, drawData, speed)
-    elif select_alg.get() == "Bucket Sort":
-        bucket_sort(data, drawData, speed)
-    elif select_alg.get() == "Bucket Sort Opt":
-        bucket_sort_optimized(data, drawData, speed)
-    elif select_alg.get() == "Bogo Sort":
-        bogoSort(data, drawData, speed)
+    options = {}
+    if get(select_alg.get()).budgeted:
+        # Bogo/Slow Sort can run for ages on the sizes the UI allows
+        options['budget'] = WorkBudget(max_seconds=MAX_SORT_SECONDS)
+
+    frames = FrameBudget(drawData, int(fpsEntry.get()), speed)
+
+    try:
+        run_sort(select_alg.get(), data, frames, 0, **options)
+        # The sort's own final frame may have been skipped
+        drawData(data, ['Blue' for _ in range(len(data))])
+    except BudgetExceeded:
+        messagebox.showinfo("Sorting Stopped", f"Gave up after {MAX_SORT_SECONDS} seconds ({options['budget'].ops} steps)")
+        return
 
     end_time = time.time()  # Record end time
     sorting_time = round(end_time - start_time, 5)
@@ -113,7 +125,7 @@ canvas.pack(side=TOP, pady=10, expand=True, fill=BOTH)
 
 # Algorithm selection menu
 Label(Mainframe, text="ALGORITHM", bg='Grey').grid(row=0, column=0, padx=5, pady=5, sticky=W)
-algmenu = ttk.Combobox(Mainframe, textvariable=select_alg, values=["Bubble Sort", "Quick Sort","Quick Sort Opt", "Merge Sort","Merge Sort Opt", "Heap Sort","Heap Sort Opt", "Kirkpatrick-Reisch Sort", "Slow Sort", "Bucket Sort","Bucket Sort Opt", "Bogo Sort"])
+algmenu = ttk.Combobox(Mainframe, textvariable=select_alg, values=names())
 algmenu.grid(row=0, column=1, padx=5, pady=5)
 algmenu.current(0)
 
@@ -128,8 +140,13 @@ Button(Mainframe, text="EXIT", bg="Red", command=exit_app).grid(row=1, column=5,
 speedbar = Scale(Mainframe, from_=0.10, to=2.0, length=100, digits=2, resolution=0.2, orient=HORIZONTAL, label="Select Speed")
 speedbar.grid(row=0, column=2, padx=5, pady=5)
 
+# Redraw limit, 0 draws every operation
+fpsEntry = Scale(Mainframe, from_=0, to=60, resolution=1, orient=HORIZONTAL, label="Max FPS")
+fpsEntry.set(30)
+fpsEntry.grid(row=0, column=4, padx=5, pady=5)
+
 # Data size selection
-sizeEntry = Scale(Mainframe, from_=3, to=60, resolution=1, orient=HORIZONTAL, label="Size")
+sizeEntry = Scale(Mainframe, from_=3, to=1000, resolution=1, orient=HORIZONTAL, label="Size")
 sizeEntry.grid(row=1, column=0, padx=5, pady=5)
 
 # Min value selection
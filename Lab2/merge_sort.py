@@ -1,6 +1,6 @@
 import time
 
-def merge(arr, left, mid, right, drawData, speed):
+def merge(arr, left, mid, right, drawData=None, speed=0):
     n1 = mid - left + 1
     n2 = right - mid
 
@@ -17,28 +17,32 @@ def merge(arr, left, mid, right, drawData, speed):
             arr[k] = R[j]
             j += 1
         k += 1
-        drawData(arr, ['Green' if left <= x <= right else 'Red' for x in range(len(arr))])
-        time.sleep(speed)
+        if drawData:
+            drawData(arr, ['Green' if left <= x <= right else 'Red' for x in range(len(arr))])
+            time.sleep(speed)
 
     while i < n1:
         arr[k] = L[i]
         i += 1
         k += 1
-        drawData(arr, ['Green' if left <= x <= right else 'Red' for x in range(len(arr))])
-        time.sleep(speed)
+        if drawData:
+            drawData(arr, ['Green' if left <= x <= right else 'Red' for x in range(len(arr))])
+            time.sleep(speed)
 
     while j < n2:
         arr[k] = R[j]
         j += 1
         k += 1
-        drawData(arr, ['Green' if left <= x <= right else 'Red' for x in range(len(arr))])
-        time.sleep(speed)
+        if drawData:
+            drawData(arr, ['Green' if left <= x <= right else 'Red' for x in range(len(arr))])
+            time.sleep(speed)
 
-def merge_sort(arr, left, right, drawData, speed):
+def merge_sort(arr, left, right, drawData=None, speed=0):
     if left < right:
         mid = (left + right) // 2
 
         merge_sort(arr, left, mid, drawData, speed)
         merge_sort(arr, mid + 1, right, drawData, speed)
         merge(arr, left, mid, right, drawData, speed)
-        drawData(arr, ['Blue' for _ in range(len(arr))]) 
+        if drawData:
+            drawData(arr, ['Blue' for _ in range(len(arr))]) 
@@ -1,6 +1,6 @@
 import time
 
-def merge_sort_optimized(data, drawData, speed, threshold=10):
+def merge_sort_optimized(data, drawData=None, speed=0, threshold=10):
     n = len(data)
 
     if n <= threshold:
@@ -16,7 +16,7 @@ def merge_sort_optimized(data, drawData, speed, threshold=10):
             merge_in_place(data, left, mid, right, drawData, speed)
 
         size *= 2 
-def merge_in_place(data, left, mid, right, drawData, speed):
+def merge_in_place(data, left, mid, right, drawData=None, speed=0):
     i, j = left, mid + 1
 
     while i <= mid and j <= right:
@@ -34,10 +34,11 @@ def merge_in_place(data, left, mid, right, drawData, speed):
             mid += 1
             j += 1
 
-        drawData(data, ['Green' if left <= x <= right else 'Red' for x in range(len(data))])
-        time.sleep(speed)
+        if drawData:
+            drawData(data, ['Green' if left <= x <= right else 'Red' for x in range(len(data))])
+            time.sleep(speed)
 
-def insertion_sort(data, drawData, speed):
+def insertion_sort(data, drawData=None, speed=0):
 
     for i in range(1, len(data)):
         key = data[i]
@@ -47,5 +48,6 @@ def insertion_sort(data, drawData, speed):
             j -= 1
         data[j + 1] = key
 
-        drawData(data, ['Blue' for _ in range(len(data))])
-        time.sleep(speed)
+        if drawData:
+            drawData(data, ['Blue' for _ in range(len(data))])
+            time.sleep(speed)
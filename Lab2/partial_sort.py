@@ -0,0 +1,109 @@
+import random
+from heap_sort_opt import heap_sort_optimized, heapify
+from quick_sort_opt import hoare_partition, quicksort_optimized
+
+
+def top_k_smallest(data, k):
+    """The k smallest values in ascending order, in O(n log k)."""
+    k = min(k, len(data))
+    if k <= 0:
+        return []
+
+    # Max-heap of the best k seen so far, its root is the one to beat
+    heap = list(data[:k])
+    for i in range(k // 2 - 1, -1, -1):
+        heapify(heap, k, i)
+    for value in data[k:]:
+        if value < heap[0]:
+            heap[0] = value
+            heapify(heap, k, 0)
+
+    heap_sort_optimized(heap)
+    return heap
+
+def top_k_largest(data, k):
+    """The k largest values in descending order (numeric data only)."""
+    return [-value for value in top_k_smallest([-value for value in data], k)]
+
+def quickselect(data, k, low=0, high=None):
+    """Rearrange data in place so data[k] is the k-th smallest (0-based) value,
+    everything before it is <= data[k] and everything after it is >= data[k]."""
+    if high is None:
+        high = len(data) - 1
+
+    while low < high:
+        # A random pivot keeps sorted input from degrading to O(n^2)
+        pivot = random.randint(low, high)
+        data[low], data[pivot] = data[pivot], data[low]
+
+        split = hoare_partition(data, low, high)
+        if k <= split:
+            high = split
+        else:
+            low = split + 1
+    return data[k]
+
+def partial_quicksort(data, k):
+    """Sort only data[:k] in place; the rest ends up in no particular order."""
+    stack = [(0, len(data) - 1)]
+
+    while stack:
+        low, high = stack.pop()
+        if low < high and low < k:
+            pivot = random.randint(low, high)
+            data[low], data[pivot] = data[pivot], data[low]
+
+            split = hoare_partition(data, low, high)
+            if split + 1 < k:
+                stack.append((split + 1, high))
+            stack.append((low, split))
+
+def benchmark_partial(n=100000, k=100, repeats=3):
+    import time
+
+    def full_quicksort(data):
+        quicksort_optimized(data)
+        return data[:k]
+
+    def full_heapsort(data):
+        heap_sort_optimized(data)
+        return data[:k]
+
+    def select_then_sort(data):
+        quickselect(data, k - 1)
+        head = data[:k]
+        quicksort_optimized(head)
+        return head
+
+    def partial(data):
+        partial_quicksort(data, k)
+        return data[:k]
+
+    candidates = [
+        ("Heap top-k", lambda data: top_k_smallest(data, k)),
+        ("Quickselect + sort k", select_then_sort),
+        ("Partial quicksort", partial),
+        ("Quick Sort Opt + slice", full_quicksort),
+        ("Heap Sort Opt + slice", full_heapsort),
+    ]
+
+    original = [random.randint(0, 10 ** 9) for _ in range(n)]
+    expected = sorted(original)[:k]
+    times = {}
+    for name, run in candidates:
+        best = float('inf')
+        for _ in range(repeats):
+            data = original[:]
+            start = time.perf_counter()
+            result = run(data)
+            best = min(best, time.perf_counter() - start)
+            assert result == expected, name
+        times[name] = best
+
+    print(f"Smallest {k} of {n} values (best of {repeats}):")
+    for name, seconds in times.items():
+        print(f"{name:<25}{seconds * 1000:>10.2f} ms")
+    return times
+
+if __name__ == "__main__":
+    benchmark_partial()
@@ -1,13 +1,14 @@
 import time
 
-def quicksort(data, low, high, drawData, speed):
+def quicksort(data, low, high, drawData=None, speed=0):
     if low < high:
         pi = partition(data, low, high, drawData, speed)
         quicksort(data, low, pi - 1, drawData, speed)
         quicksort(data, pi + 1, high, drawData, speed)
-        drawData(data, ['Blue' for _ in range(len(data))])
+        if drawData:
+            drawData(data, ['Blue' for _ in range(len(data))])
 
-def partition(data, low, high, drawData, speed):
+def partition(data, low, high, drawData=None, speed=0):
     pivot = data[high]
     i = low - 1
 
@@ -15,11 +16,13 @@ def partition(data, low, high, drawData, speed):
         if data[j] < pivot:
             i += 1
             data[i], data[j] = data[j], data[i]
-            drawData(data, ['Green' if x == i or x == j else 'Red' for x in range(len(data))])
-            time.sleep(speed)
+            if drawData:
+                drawData(data, ['Green' if x == i or x == j else 'Red' for x in range(len(data))])
+                time.sleep(speed)
 
     data[i + 1], data[high] = data[high], data[i + 1]
-    drawData(data, ['Green' if x == i + 1 or x == high else 'Red' for x in range(len(data))])
-    time.sleep(speed)
+    if drawData:
+        drawData(data, ['Green' if x == i + 1 or x == high else 'Red' for x in range(len(data))])
+        time.sleep(speed)
     
     return i + 1
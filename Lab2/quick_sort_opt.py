@@ -1,6 +1,6 @@
 import time
 
-def quicksort_optimized(data, drawData, speed):
+def quicksort_optimized(data, drawData=None, speed=0):
     stack = [(0, len(data) - 1)]  
 
     while stack:
@@ -8,8 +8,9 @@ def quicksort_optimized(data, drawData, speed):
         if low < high:
             pivot_index = hoare_partition(data, low, high, drawData, speed)
 
-            drawData(data, ['Green' if low <= x <= high else 'Red' for x in range(len(data))])
-            time.sleep(speed)
+            if drawData:
+                drawData(data, ['Green' if low <= x <= high else 'Red' for x in range(len(data))])
+                time.sleep(speed)
 
             if pivot_index - low > high - pivot_index:
                 stack.append((low, pivot_index))
@@ -18,7 +19,7 @@ def quicksort_optimized(data, drawData, speed):
                 stack.append((pivot_index + 1, high))
                 stack.append((low, pivot_index))
 
-def hoare_partition(data, low, high, drawData, speed):
+def hoare_partition(data, low, high, drawData=None, speed=0):
     pivot = data[low] 
     i, j = low - 1, high + 1
 
@@ -36,5 +37,6 @@ def hoare_partition(data, low, high, drawData, speed):
             return j  
 
         data[i], data[j] = data[j], data[i]
-        drawData(data, ['Green' if x == i or x == j else 'Red' for x in range(len(data))])
-        time.sleep(speed)
+        if drawData:
+            drawData(data, ['Green' if x == i or x == j else 'Red' for x in range(len(data))])
+            time.sleep(speed)
@@ -0,0 +1,59 @@
+import numpy as np
+from algorithms import run_sort
+
+INT64_MAX = 0x7FFFFFFFFFFFFFFF
+
+
+def sortable_codes(keys):
+    # Map a key column onto int64 values with the same ordering
+    if keys.dtype.kind == 'u' and keys.dtype.itemsize == 8 and len(keys) and keys.max() > INT64_MAX:
+        # Would wrap negative as int64, so keep them as Python ints
+        return keys.astype(object)
+    if keys.dtype.kind in 'iub':
+        return keys.astype(np.int64)
+    if keys.dtype.kind == 'f':
+        floats = keys.astype(np.float64)
+        floats[floats == 0] = 0.0  # -0.0 has the sign bit set but equals 0.0
+        bits = floats.view(np.int64)
+        return np.where(bits < 0, bits ^ INT64_MAX, bits)
+    raise TypeError(f"Unsupported key dtype: {keys.dtype}")
+
+def argsort(keys, algorithm="Heap Sort Opt"):
+    """Index permutation that sorts keys, computed with a Lab2 algorithm.
+
+    Each row is packed into a single int (key code * n + row), so the chosen
+    sort compares plain ints and ties fall back to the row, which also makes
+    the result stable.
+    """
+    keys = np.asarray(keys)
+    n = len(keys)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+
+    codes = sortable_codes(keys)
+    low = int(codes.min())
+    span = int(codes.max()) - low
+
+    if (span + 1) * n <= INT64_MAX:
+        packed = ((codes - low) * n + np.arange(n, dtype=np.int64)).tolist()
+        run_sort(algorithm, packed)
+        return np.array(packed, dtype=np.int64) % n
+
+    packed = [(code - low) * n + row for row, code in enumerate(codes.tolist())]
+    run_sort(algorithm, packed)
+    return np.fromiter((value % n for value in packed), dtype=np.int64, count=n)
+
+def sort_records(keys, payload, algorithm="Heap Sort Opt"):
+    """Sort a key column and gather its payload in one vectorized pass.
+
+    payload is an array with one row per key or a dict of such columns.
+    """
+    keys = np.asarray(keys)
+    order = argsort(keys, algorithm)
+
+    if isinstance(payload, dict):
+        gathered = {name: np.take(np.asarray(column), order, axis=0) for name, column in payload.items()}
+    else:
+        gathered = np.take(np.asarray(payload), order, axis=0)
+
+    return keys[order], gathered
@@ -1,19 +1,23 @@
 import time
 
-def slow_sort(arr, left, right, drawData, speed):
+def slow_sort(arr, left, right, drawData=None, speed=0, budget=None):
+    if budget:
+        budget.spend()
     if left >= right:
         return
 
     mid = (left + right) // 2
-    slow_sort(arr, left, mid, drawData, speed)
-    slow_sort(arr, mid + 1, right, drawData, speed)
+    slow_sort(arr, left, mid, drawData, speed, budget)
+    slow_sort(arr, mid + 1, right, drawData, speed, budget)
 
     if arr[right] < arr[mid]:
         arr[right], arr[mid] = arr[mid], arr[right]
 
-        drawData(arr, ['Green' if left <= x <= right else 'Red' for x in range(len(arr))])
-        time.sleep(speed)
+        if drawData:
+            drawData(arr, ['Green' if left <= x <= right else 'Red' for x in range(len(arr))])
+            time.sleep(speed)
 
-    slow_sort(arr, left, right - 1, drawData, speed)
+    slow_sort(arr, left, right - 1, drawData, speed, budget)
 
-    drawData(arr, ['Blue' for _ in range(len(arr))])  # Final sorted state
+    if drawData:
+        drawData(arr, ['Blue' for _ in range(len(arr))])  # Final sorted state
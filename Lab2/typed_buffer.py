@@ -0,0 +1,57 @@
+from array import array
+from algorithms import get, run_sort
+
+
+class TypedBuffer:
+    """List-like wrapper that lets the Lab2 sorts run on typed memory.
+
+    Wraps an array.array or a 1-D NumPy array through a memoryview, so
+    values are stored unboxed (4 or 8 bytes each) and every read hands the
+    sort a plain Python int or float, which keeps comparisons on the fast
+    built-in path.  Slicing returns a list copy and slice assignment takes
+    any iterable, matching how the sorts use Python lists.
+    """
+
+    def __init__(self, buffer):
+        self.base = buffer
+        self.view = memoryview(buffer)
+        if self.view.ndim != 1:
+            raise ValueError("TypedBuffer needs a one dimensional buffer")
+        self.typecode = self.view.format
+
+    def __len__(self):
+        return len(self.view)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.view[index].tolist()
+        return self.view[index]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self.view[index] = array(self.typecode, value)
+        else:
+            self.view[index] = value
+
+    def __iter__(self):
+        return iter(self.view)
+
+    def tolist(self):
+        return self.view.tolist()
+
+    def __repr__(self):
+        return f"TypedBuffer({self.typecode!r}, {len(self)} items)"
+
+
+def sort_typed(algorithm, buffer, drawData=None, speed=0):
+    """Sort an array.array or NumPy array in place with a registered Lab2 sort."""
+    if isinstance(buffer, TypedBuffer):
+        buffer = buffer.base
+
+    if get(algorithm).in_place:
+        # In-place sorts only index and swap, which a bare memoryview does in C
+        target = memoryview(buffer)
+    else:
+        target = TypedBuffer(buffer)
+    run_sort(algorithm, target, drawData, speed)
+    return buffer
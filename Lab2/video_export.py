@@ -0,0 +1,150 @@
+import os
+import shutil
+import subprocess
+from multiprocessing import Pool
+import numpy as np
+
+# Tk colors used by the sorts, as RGB
+PALETTE = {
+    'Grey': (190, 190, 190),
+    'Red': (255, 0, 0),
+    'Green': (0, 255, 0),
+    'Blue': (0, 0, 255),
+    'Yellow': (255, 255, 0),
+}
+COLOR_NAMES = list(PALETTE)
+COLOR_CODES = {name: code for code, name in enumerate(COLOR_NAMES)}
+PALETTE_RGB = np.array([PALETTE[name] for name in COLOR_NAMES], dtype=np.uint8)
+
+
+class FrameRecorder:
+    """drawData replacement that stores frames instead of drawing them.
+
+    Once more than max_frames are stored every other frame is dropped and
+    only every second call is kept from then on, so memory stays bounded
+    however many operations the sort performs.
+    """
+
+    def __init__(self, max_frames=3000):
+        self.max_frames = max_frames
+        self.values = []
+        self.colors = []
+        self.every = 1
+        self.calls = 0
+        self.vmax = 0
+
+    def __call__(self, data, colorlist):
+        self.calls += 1
+        if self.calls % self.every:
+            return
+
+        values = np.array(data, dtype=np.float64)
+        self.values.append(values)
+        self.colors.append(np.fromiter((COLOR_CODES[c] for c in colorlist), dtype=np.uint8, count=len(colorlist)))
+        if len(values):
+            self.vmax = max(self.vmax, float(values.max()))
+
+        if len(self.values) > self.max_frames:
+            self.values = self.values[::2]
+            self.colors = self.colors[::2]
+            self.every *= 2
+
+    def __len__(self):
+        return len(self.values)
+
+    def __bool__(self):
+        # The sorts only draw under "if drawData:", so an empty recorder must stay truthy
+        return True
+
+
+def render_frame(values, colors, width=1280, height=720, vmax=None):
+    n = len(values)
+    if n == 0:
+        return np.broadcast_to(PALETTE_RGB[COLOR_CODES['Grey']], (height, width, 3)).copy()
+
+    vmax = vmax or values.max() or 1
+    columns = np.arange(width)
+    bar = columns * n // width
+    # Leave a one pixel gap between bars while they are wide enough
+    if width // n >= 3:
+        gap = (columns + 1) * n // width != bar
+        bar = np.where(gap, -1, bar)
+
+    heights = (np.clip(values, 0, None) / vmax * (height - 20)).astype(np.int64)
+    top = np.where(bar >= 0, height - heights[bar], height)
+    # Palette index per pixel, background where the row is above the bar top
+    codes = np.where(np.arange(height)[:, None] >= top[None, :], colors[bar][None, :], COLOR_CODES['Grey'])
+    return PALETTE_RGB[codes.astype(np.uint8)]
+
+def render_job(job):
+    values, colors, width, height, vmax = job
+    return render_frame(values, colors, width, height, vmax).tobytes()
+
+def export_video(recorder, path, fps=60, width=1280, height=720, processes=None, chunk=16):
+    """Encode the recorded frames with ffmpeg running as a background process.
+
+    Frames are rendered in worker processes and written to ffmpeg in order
+    as they come back.
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg was not found on PATH, use export_png_sequence instead")
+
+    command = [ffmpeg, "-y", "-loglevel", "error",
+               "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+               "-pix_fmt", "yuv420p", "-vcodec", "libx264", path]
+    jobs = ((values, colors, width, height, recorder.vmax) for values, colors in zip(recorder.values, recorder.colors))
+    encoder = subprocess.Popen(command, stdin=subprocess.PIPE)
+    try:
+        with Pool(processes) as pool:
+            for frame in pool.imap(render_job, jobs, chunk):
+                encoder.stdin.write(frame)
+    finally:
+        encoder.stdin.close()
+        encoder.wait()
+    if encoder.returncode != 0:
+        raise RuntimeError(f"ffmpeg exited with code {encoder.returncode}")
+
+def save_png_frames(job):
+    import matplotlib.image
+    directory, start, frames, width, height, vmax = job
+    for offset, (values, colors) in enumerate(frames):
+        path = os.path.join(directory, f"frame_{start + offset:06d}.png")
+        matplotlib.image.imsave(path, render_frame(values, colors, width, height, vmax))
+
+def export_png_sequence(recorder, directory, width=1280, height=720, processes=None, chunk=100):
+    """Render the recorded frames to numbered PNG files in worker processes."""
+    os.makedirs(directory, exist_ok=True)
+    frames = list(zip(recorder.values, recorder.colors))
+    jobs = [(directory, start, frames[start:start + chunk], width, height, recorder.vmax)
+            for start in range(0, len(frames), chunk)]
+    with Pool(processes) as pool:
+        pool.map(save_png_frames, jobs)
+
+def record(algorithm, data, max_frames=3000):
+    from algorithms import run_sort
+    recorder = FrameRecorder(max_frames)
+    data = list(data)
+    recorder(data, ['Red'] * len(data))
+    run_sort(algorithm, data, recorder, 0)
+    recorder(data, ['Blue'] * len(data))
+    return recorder
+
+if __name__ == "__main__":
+    import argparse
+    import random
+
+    parser = argparse.ArgumentParser(description="Render a Lab2 sorting run to video without a display")
+    parser.add_argument("algorithm", help='name as shown in the GUI, e.g. "Heap Sort"')
+    parser.add_argument("output", help=".mp4 file, or a directory for a PNG sequence")
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--fps", type=int, default=60)
+    parser.add_argument("--max-frames", type=int, default=3000)
+    args = parser.parse_args()
+
+    recorder = record(args.algorithm, [random.randint(1, 100) for _ in range(args.size)], args.max_frames)
+    if args.output.endswith(".mp4"):
+        export_video(recorder, args.output, args.fps)
+    else:
+        export_png_sequence(recorder, args.output)
+    print(f"Wrote {len(recorder)} frames from {recorder.calls} drawData calls")
@@ -0,0 +1,144 @@
+import gc
+import math
+import os
+import statistics
+import time
+from graph import Graph
+from graph_io import load_or_generate
+
+# Two-sided 95% Student t critical values by degrees of freedom
+T_95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+        9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 25: 2.060, 30: 2.042}
+
+TRAVERSALS = {
+    "DFS": lambda graph, start: graph.dfs(start),
+    "BFS": lambda graph, start: graph.bfs(start),
+    "BFS frontier": lambda graph, start: graph.bfs_levels(start),
+}
+
+
+def t_critical(df):
+    if df <= 0:
+        return float('nan')
+    if df > 30:
+        return 1.96
+    return T_95[max(key for key in T_95 if key <= df)]
+
+def confidence_interval(samples):
+    """Mean and 95% half-width of the samples."""
+    mean = statistics.fmean(samples)
+    if len(samples) < 2:
+        return mean, float('nan')
+    return mean, t_critical(len(samples) - 1) * statistics.stdev(samples) / math.sqrt(len(samples))
+
+def time_call(function, repeats=7, warmup=2, max_seconds=None):
+    """Run function warmup times untimed, then time each repeat in ns with GC off.
+
+    With max_seconds the number of repeats is cut so slow calls stay
+    within the budget (at least three are always kept).
+    """
+    for _ in range(warmup):
+        function()
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        budget_start = time.perf_counter_ns()
+        for i in range(repeats):
+            start = time.perf_counter_ns()
+            function()
+            samples.append(time.perf_counter_ns() - start)
+            spent = (time.perf_counter_ns() - budget_start) / 1e9
+            if max_seconds is not None and i >= 2 and spent > max_seconds:
+                break
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+def random_graph(size, edge_probability, seed, cache_dir=None):
+    def generate():
+        graph = Graph(size)
+        graph.generate_random_graph(edge_probability=edge_probability, seed=seed)
+        return graph
+
+    if cache_dir is None:
+        return generate()
+    os.makedirs(cache_dir, exist_ok=True)
+    return load_or_generate(os.path.join(cache_dir, f"gnp_{size}_{edge_probability:.3g}_{seed}.csr"), generate)
+
+def benchmark_traversals(sizes, graphs_per_size=5, repeats=7, warmup=2, edge_factor=2,
+                         traversals=TRAVERSALS, max_seconds_per_graph=10, seed=0, cache_dir=None):
+    """Time each traversal on several random graphs per size.
+
+    Graphs are the independent samples: each graph contributes the median
+    of its repeats, and the confidence interval is taken over graphs.
+    With cache_dir each graph is generated once, saved there and
+    memory-mapped on later runs, so every run times identical inputs.
+    Returns {name: [(size, mean_ms, ci_ms, min_ms), ...]}.
+    """
+    results = {name: [] for name in traversals}
+
+    for size in sizes:
+        per_graph = {name: [] for name in traversals}
+        best = {name: float('inf') for name in traversals}
+
+        for g in range(graphs_per_size):
+            graph = random_graph(size, edge_factor / size, seed + g, cache_dir)
+            graph.csr()
+            if "BFS frontier" in traversals:
+                graph.reverse()
+
+            for name, traversal in traversals.items():
+                samples = time_call(lambda: traversal(graph, 0), repeats, warmup, max_seconds_per_graph)
+                per_graph[name].append(statistics.median(samples) / 1e6)
+                best[name] = min(best[name], min(samples) / 1e6)
+
+        for name in traversals:
+            mean, half_width = confidence_interval(per_graph[name])
+            results[name].append((size, mean, half_width, best[name]))
+
+    return results
+
+def print_results(results):
+    print(f"{'Algorithm':<14}{'Vertices':>10}{'Mean (ms)':>14}{'95% CI (ms)':>14}{'Min (ms)':>12}")
+    for name, rows in results.items():
+        for size, mean, half_width, best in rows:
+            print(f"{name:<14}{size:>10}{mean:>14.4f}{'±' + format(half_width, '.4f'):>14}{best:>12.4f}")
+
+def plot_results(results, filename="benchmark_traversals.png"):
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, 6))
+    for name, rows in results.items():
+        sizes = [row[0] for row in rows]
+        plt.errorbar(sizes, [row[1] for row in rows], yerr=[row[2] for row in rows], fmt='o-', capsize=4, label=name)
+    plt.xscale('log')
+    plt.yscale('log')
+    plt.xlabel('Number of Vertices')
+    plt.ylabel('Execution Time (ms), mean with 95% CI')
+    plt.title('Traversal Time vs. Graph Size')
+    plt.legend()
+    plt.grid(True, which='both')
+    plt.tight_layout()
+    plt.savefig(filename)
+    plt.close()
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark Lab3 DFS/BFS on random sparse graphs")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7])
+    parser.add_argument("--graphs", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--cache-dir", help="save generated graphs here and reuse them on later runs")
+    parser.add_argument("--plot", action="store_true")
+    args = parser.parse_args()
+
+    results = benchmark_traversals(args.sizes, args.graphs, args.repeats, args.warmup, cache_dir=args.cache_dir)
+    print_results(results)
+    if args.plot:
+        plot_results(results)
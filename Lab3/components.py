@@ -0,0 +1,110 @@
+from array import array
+import numpy as np
+
+
+def strongly_connected_components(graph):
+    """Tarjan's SCC algorithm with an explicit call stack over the CSR arrays.
+
+    Returns (labels, count): labels is an int32 array giving each vertex's
+    component, numbered in the order Tarjan completes them (reverse
+    topological order of the condensation).
+    """
+    offsets, targets = graph.csr()
+    offsets, targets = memoryview(offsets), memoryview(targets)
+    V = graph.V
+
+    index = array('i', [-1]) * V
+    low = array('i', [0]) * V
+    labels = array('i', [-1]) * V
+    on_stack = bytearray(V)
+    component_stack = []
+    counter = 0
+    count = 0
+
+    for root in range(V):
+        if index[root] != -1:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        component_stack.append(root)
+        on_stack[root] = 1
+        call_vertices = [root]
+        call_positions = [offsets[root]]
+
+        while call_vertices:
+            vertex = call_vertices[-1]
+            position = call_positions[-1]
+            end = offsets[vertex + 1]
+            descended = False
+
+            while position < end:
+                neighbor = targets[position]
+                position += 1
+                if index[neighbor] == -1:
+                    call_positions[-1] = position
+                    index[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    component_stack.append(neighbor)
+                    on_stack[neighbor] = 1
+                    call_vertices.append(neighbor)
+                    call_positions.append(offsets[neighbor])
+                    descended = True
+                    break
+                if on_stack[neighbor] and index[neighbor] < low[vertex]:
+                    low[vertex] = index[neighbor]
+            if descended:
+                continue
+
+            call_vertices.pop()
+            call_positions.pop()
+            if low[vertex] == index[vertex]:
+                while True:
+                    member = component_stack.pop()
+                    on_stack[member] = 0
+                    labels[member] = count
+                    if member == vertex:
+                        break
+                count += 1
+            if call_vertices:
+                parent = call_vertices[-1]
+                if low[vertex] < low[parent]:
+                    low[parent] = low[vertex]
+
+    return np.frombuffer(labels, dtype=np.int32).copy(), count
+
+def weakly_connected_components(graph):
+    """Components when edge direction is ignored, using union-find.
+
+    Returns (labels, count) with labels numbered 0..count-1 by smallest vertex.
+    """
+    offsets, targets = graph.csr()
+    sources = np.repeat(np.arange(graph.V, dtype=np.int32), np.diff(offsets))
+    parent = array('i', range(graph.V))
+
+    for u, v in zip(sources.tolist(), targets.tolist()):
+        # Find both roots with path halving, then hook the larger id under the smaller
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]
+            u = parent[u]
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        if u < v:
+            parent[v] = u
+        elif v < u:
+            parent[u] = v
+
+    roots = np.frombuffer(parent, dtype=np.int32).copy()
+    # Pointer jumping until every vertex points straight at its root
+    while True:
+        jumped = roots[roots]
+        if (jumped == roots).all():
+            break
+        roots = jumped
+
+    unique_roots, labels = np.unique(roots, return_inverse=True)
+    return labels.astype(np.int32), len(unique_roots)
+
+def component_sizes(labels, count):
+    return np.bincount(labels, minlength=count)
@@ -0,0 +1,115 @@
+import numpy as np
+from graph import Graph
+
+COMMENT_PREFIXES = (b"#", b"%")
+
+
+def parse_block(block, columns):
+    """Source and target ids from whole lines of whitespace separated text."""
+    if b"#" in block or b"%" in block:
+        block = b"\n".join(line for line in block.split(b"\n")
+                           if not line.lstrip().startswith(COMMENT_PREFIXES))
+    # Extra columns (weights, timestamps) may be fractional, so those files are parsed as floats
+    values = np.fromstring(block, dtype=np.int64 if columns == 2 else np.float64, sep=' ')
+    if len(values) % columns:
+        raise ValueError(f"expected {columns} columns per line")
+    values = values.reshape(-1, columns)
+    return values[:, 0].astype(np.int64), values[:, 1].astype(np.int64)
+
+def read_edge_chunks(filename, chunk_bytes=1 << 26):
+    """Yield (sources, targets) arrays for each chunk of a SNAP-style edge list.
+
+    The file is read in binary blocks cut at the last newline and each
+    block is parsed by NumPy in one call.  Lines starting with '#' or '%'
+    are comments; the size line after a %%MatrixMarket banner is skipped.
+    """
+    columns = None
+    skip_size_line = False
+    leftover = b""
+
+    with open(filename, "rb") as file:
+        while True:
+            block = file.read(chunk_bytes)
+            if block:
+                block = leftover + block
+                cut = block.rfind(b"\n") + 1
+                leftover = block[cut:]
+                block = block[:cut]
+            else:
+                block, leftover = leftover, b""
+            if not block:
+                if leftover:
+                    continue
+                break
+
+            if columns is None:
+                skip_size_line |= block.startswith(b"%%MatrixMarket")
+                lines = block.split(b"\n")
+                data = [i for i, line in enumerate(lines)
+                        if line.strip() and not line.lstrip().startswith(COMMENT_PREFIXES)]
+                if skip_size_line and data:
+                    # Drop everything up to and including the "rows cols entries" line
+                    block = b"\n".join(lines[data[0] + 1:])
+                    data = data[1:]
+                    skip_size_line = False
+                if not data:
+                    continue
+                columns = len(lines[data[0]].split())
+                if columns < 2:
+                    raise ValueError(f"{filename}: edge lines need a source and a target")
+
+            yield parse_block(block, columns)
+
+def load_edge_list(filename, undirected=False, relabel=True, chunk_bytes=1 << 26):
+    """Build a Lab3 Graph from an edge list file.
+
+    With relabel, the (possibly sparse) vertex ids are mapped to 0..V-1 in
+    increasing order and ids[v] gives the original id of vertex v;
+    otherwise ids are used as they are and V is the largest id + 1.
+    undirected adds every edge in both directions.  Returns (graph, ids),
+    ids being None when relabel is off.
+    """
+    source_chunks, target_chunks = [], []
+    for sources, targets in read_edge_chunks(filename, chunk_bytes):
+        source_chunks.append(sources)
+        target_chunks.append(targets)
+    sources = np.concatenate(source_chunks) if source_chunks else np.zeros(0, dtype=np.int64)
+    targets = np.concatenate(target_chunks) if target_chunks else np.zeros(0, dtype=np.int64)
+    del source_chunks, target_chunks
+
+    if relabel:
+        ids, dense = np.unique(np.concatenate((sources, targets)), return_inverse=True)
+        sources, targets = dense[:len(sources)], dense[len(sources):]
+        vertices = len(ids)
+    else:
+        ids = None
+        vertices = int(max(sources.max(initial=-1), targets.max(initial=-1))) + 1
+
+    if undirected:
+        sources, targets = np.concatenate((sources, targets)), np.concatenate((targets, sources))
+    return Graph.from_edges(vertices, sources, targets), ids
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Run DFS and BFS on a SNAP-style edge list")
+    parser.add_argument("filename")
+    parser.add_argument("--undirected", action="store_true")
+    parser.add_argument("--start", type=int, help="original id of the start vertex (default: smallest id)")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    graph, ids = load_edge_list(args.filename, undirected=args.undirected)
+    print(f"Loaded {graph.V} vertices and {graph.E} edges in {time.perf_counter() - start_time:.2f} s")
+
+    start = 0 if args.start is None else int(np.searchsorted(ids, args.start))
+    if args.start is not None and (start == len(ids) or ids[start] != args.start):
+        parser.error(f"vertex {args.start} does not appear in the file")
+
+    dfs_path, dfs_time = graph.dfs(start)
+    bfs_path, bfs_time = graph.bfs(start)
+    levels, levels_time = graph.bfs_levels(start)
+    print(f"DFS reached {len(dfs_path)} vertices in {dfs_time:.3f} s")
+    print(f"BFS reached {len(bfs_path)} vertices in {bfs_time:.3f} s")
+    print(f"Frontier BFS reached {int((levels >= 0).sum())} vertices, depth {levels.max()}, in {levels_time:.3f} s")
@@ -0,0 +1,292 @@
+import time
+from array import array
+from collections import deque
+import numpy as np
+
+
+class Graph:
+    """Directed graph stored as compressed sparse row (CSR) arrays.
+
+    add_edge only appends to compact edge buffers; the first query packs
+    them into offsets (V + 1 int64) and targets (E int32), so the
+    neighbours of v are targets[offsets[v]:offsets[v + 1]] in insertion
+    order.  That is 4 bytes per edge instead of a Python list per vertex.
+    """
+
+    def __init__(self, vertices):
+        self.V = vertices
+        self.offsets = np.zeros(vertices + 1, dtype=np.int64)
+        self.targets = np.zeros(0, dtype=np.int32)
+        self._pending_src = array('i')
+        self._pending_dst = array('i')
+        self._reverse = None
+
+    @classmethod
+    def from_edges(cls, vertices, sources, targets):
+        graph = cls(vertices)
+        graph.build(np.asarray(sources, dtype=np.int64), np.asarray(targets, dtype=np.int32))
+        return graph
+
+    @classmethod
+    def from_csr(cls, offsets, targets, reverse=None):
+        graph = cls(len(offsets) - 1)
+        graph.offsets = offsets
+        graph.targets = targets
+        graph._reverse = reverse
+        return graph
+
+    def add_edge(self, v, w):
+        self._pending_src.append(v)
+        self._pending_dst.append(w)
+
+    def build(self, sources=None, targets=None):
+        # Pack existing CSR edges, buffered edges and new edges together, stable by source
+        source_parts, target_parts = [], []
+        if len(self.targets):
+            source_parts.append(np.repeat(np.arange(self.V, dtype=np.int64), np.diff(self.offsets)))
+            target_parts.append(self.targets)
+        if self._pending_src:
+            source_parts.append(np.frombuffer(self._pending_src, dtype=np.int32))
+            target_parts.append(np.frombuffer(self._pending_dst, dtype=np.int32))
+        if sources is not None:
+            source_parts.append(sources)
+            target_parts.append(targets)
+        if not source_parts:
+            return
+        sources = np.concatenate(source_parts) if len(source_parts) > 1 else source_parts[0]
+        targets = np.concatenate(target_parts) if len(target_parts) > 1 else target_parts[0]
+
+        order = np.argsort(sources, kind='stable')
+        counts = np.bincount(sources, minlength=self.V)
+        self.targets = np.ascontiguousarray(targets[order], dtype=np.int32)
+        self.offsets = np.zeros(self.V + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.offsets[1:])
+        self._pending_src = array('i')
+        self._pending_dst = array('i')
+        self._reverse = None
+
+    def csr(self):
+        if self._pending_src:
+            self.build()
+        return self.offsets, self.targets
+
+    def reverse(self):
+        """CSR of the transposed graph (in-neighbours), built once and cached."""
+        if self._reverse is None or self._pending_src:
+            offsets, targets = self.csr()
+            sources = np.repeat(np.arange(self.V, dtype=np.int32), np.diff(offsets))
+            self._reverse = Graph.from_edges(self.V, targets, sources)
+        return self._reverse
+
+    @property
+    def E(self):
+        offsets, _ = self.csr()
+        return int(offsets[-1])
+
+    def neighbors(self, vertex):
+        offsets, targets = self.csr()
+        return targets[offsets[vertex]:offsets[vertex + 1]]
+
+    def generate_random_graph(self, edge_probability=0.2, seed=None):
+        sources, targets = gnp_random_edges(self.V, edge_probability, np.random.default_rng(seed))
+        self.build(sources, targets)
+
+    def dfs(self, start_vertex, mode="iterator", parents=None):
+        """Iterative DFS, same preorder as the recursive version but no recursion limit.
+
+        mode="iterator" keeps (vertex, next edge) frames so each vertex is
+        pushed once; mode="stack" pushes unvisited neighbours in reverse and
+        skips the duplicates when they are popped.  If parents (an integer
+        array of length V) is given, parents[v] is set to the vertex v was
+        discovered from, so the DFS tree edges are (parents[v], v).
+        """
+        offsets, targets = self.csr()
+        # memoryviews hand out plain ints, far cheaper than NumPy scalars in a Python loop
+        offsets, targets = memoryview(offsets), memoryview(targets)
+        visited = bytearray(self.V)
+        path = []
+        start_time = time.perf_counter()
+
+        if mode == "iterator":
+            visited[start_vertex] = 1
+            path.append(start_vertex)
+            vertices = [start_vertex]
+            positions = [offsets[start_vertex]]
+
+            while vertices:
+                vertex = vertices[-1]
+                position = positions[-1]
+                end = offsets[vertex + 1]
+                while position < end and visited[targets[position]]:
+                    position += 1
+
+                if position == end:
+                    vertices.pop()
+                    positions.pop()
+                    continue
+
+                neighbor = targets[position]
+                positions[-1] = position + 1
+                visited[neighbor] = 1
+                if parents is not None:
+                    parents[neighbor] = vertex
+                path.append(neighbor)
+                vertices.append(neighbor)
+                positions.append(offsets[neighbor])
+        elif mode == "stack":
+            stack = [start_vertex]
+
+            while stack:
+                vertex = stack.pop()
+                if visited[vertex]:
+                    continue
+                visited[vertex] = 1
+                path.append(vertex)
+
+                neighbors = [neighbor for neighbor in targets[offsets[vertex]:offsets[vertex + 1]][::-1]
+                             if not visited[neighbor]]
+                stack.extend(neighbors)
+                if parents is not None:
+                    # The copy pushed last is the one popped first, so the last pusher is the parent
+                    for neighbor in neighbors:
+                        parents[neighbor] = vertex
+        else:
+            raise ValueError(f"Unknown DFS mode: {mode}")
+
+        end_time = time.perf_counter()
+
+        return path, end_time - start_time
+
+    def bfs(self, start_vertex, mode="queue", parents=None):
+        if mode == "frontier":
+            if parents is not None:
+                raise ValueError("BFS parents are only recorded in queue mode")
+            levels, elapsed = self.bfs_levels(start_vertex)
+            reached = np.flatnonzero(levels >= 0)
+            path = reached[np.argsort(levels[reached], kind='stable')].tolist()
+            return path, elapsed
+        if mode != "queue":
+            raise ValueError(f"Unknown BFS mode: {mode}")
+
+        offsets, targets = self.csr()
+        offsets, targets = memoryview(offsets), memoryview(targets)
+        visited = bytearray(self.V)
+        queue = deque([start_vertex])
+        visited[start_vertex] = 1
+        path = []
+
+        start_time = time.perf_counter()
+
+        while queue:
+            vertex = queue.popleft()
+            path.append(vertex)
+
+            for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    queue.append(neighbor)
+                    if parents is not None:
+                        parents[neighbor] = vertex
+
+        end_time = time.perf_counter()
+
+        return path, end_time - start_time
+
+
+    def bfs_levels(self, start_vertex, alpha=14, beta=24):
+        """Level-synchronous, direction-optimizing BFS over the CSR arrays.
+
+        Each frontier is expanded with vectorized gathers and deduplicated
+        through a visited map.  When the frontier's out-edges outnumber
+        1/alpha of the edges still unexplored, a bottom-up step instead lets
+        every unvisited vertex look for a parent in the frontier; it switches
+        back once the frontier drops below V/beta vertices (Beamer et al.).
+        Returns the BFS level of every vertex (-1 if unreached) and the time.
+        """
+        offsets, targets = self.csr()
+        reverse = self.reverse() if self.V else None
+        start_time = time.perf_counter()
+
+        levels = np.full(self.V, -1, dtype=np.int32)
+        visited = np.zeros(self.V, dtype=bool)
+        frontier = np.array([start_vertex], dtype=np.int64)
+        levels[start_vertex] = 0
+        visited[start_vertex] = True
+        unexplored = self.E
+        bottom_up = False
+        level = 0
+
+        while len(frontier):
+            out_degrees = offsets[frontier + 1] - offsets[frontier]
+            frontier_edges = int(out_degrees.sum())
+            unexplored -= frontier_edges
+
+            if not bottom_up and frontier_edges > unexplored / alpha:
+                bottom_up = True
+            elif bottom_up and len(frontier) < self.V / beta:
+                bottom_up = False
+
+            if bottom_up:
+                in_frontier = np.zeros(self.V, dtype=bool)
+                in_frontier[frontier] = True
+                candidates = np.flatnonzero(~visited)
+                parents, owner = gather_neighbors(reverse.offsets, reverse.targets, candidates)
+                found = np.zeros(len(candidates), dtype=bool)
+                found[owner[in_frontier[parents]]] = True
+                frontier = candidates[found]
+            else:
+                neighbors, _ = gather_neighbors(offsets, targets, frontier, out_degrees)
+                frontier = np.unique(neighbors[~visited[neighbors]]).astype(np.int64)
+
+            level += 1
+            visited[frontier] = True
+            levels[frontier] = level
+
+        end_time = time.perf_counter()
+
+        return levels, end_time - start_time
+
+
+def gather_neighbors(offsets, targets, vertices, degrees=None):
+    # All neighbours of the given vertices in one gather, plus the index of the vertex each came from
+    starts = offsets[vertices]
+    if degrees is None:
+        degrees = offsets[vertices + 1] - starts
+    owner = np.repeat(np.arange(len(vertices)), degrees)
+    edge_positions = np.arange(len(owner)) + np.repeat(starts - (np.cumsum(degrees) - degrees), degrees)
+    return targets[edge_positions], owner
+
+def gnp_random_edges(n, p, rng):
+    """Edges of a directed Erdos-Renyi G(n, p) graph without self loops.
+
+    Rather than testing all n(n-1) ordered pairs, the gaps between chosen
+    pairs are drawn from a geometric distribution (Batagelj-Brandes skip
+    sampling), vectorized in chunks, so the cost is O(V + E).  Edges come
+    out sorted by (source, target), the order the pairwise loop produced.
+    """
+    total = n * (n - 1)
+    if total == 0 or p <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int32)
+
+    if p >= 1:
+        positions = np.arange(total, dtype=np.int64)
+    else:
+        expected = total * p
+        chunk = int(expected + 6 * expected ** 0.5) + 64
+        parts = []
+        last = -1
+        while True:
+            candidates = last + np.cumsum(rng.geometric(p, size=chunk))
+            inside = candidates[candidates < total]
+            parts.append(inside)
+            if len(inside) < chunk:
+                break
+            last = inside[-1]
+        positions = np.concatenate(parts)
+
+    # Pair index k maps to source k // (n - 1) and the k % (n - 1)-th other vertex
+    sources = positions // (n - 1)
+    targets = positions % (n - 1)
+    targets += targets >= sources
+    return sources, targets.astype(np.int32)
+
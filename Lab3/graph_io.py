@@ -0,0 +1,63 @@
+import os
+import struct
+import numpy as np
+from graph import Graph
+
+# Binary CSR graph file, little endian, every array 8-byte aligned so it can be memory-mapped:
+#   header   magic, vertices, edges, has_weights  (32 bytes)
+#   offsets  int64[vertices + 1]
+#   targets  int32[edges], zero padded to a multiple of 8 bytes
+#   weights  float64[edges], only if has_weights
+MAGIC = b"AAGRAPH\x01"
+HEADER = struct.Struct("<8sqqq")
+
+
+def save_csr(filename, offsets, targets, weights=None):
+    vertices, edges = len(offsets) - 1, len(targets)
+    with open(filename, "wb") as file:
+        file.write(HEADER.pack(MAGIC, vertices, edges, weights is not None))
+        file.write(np.ascontiguousarray(offsets, dtype='<i8').data)
+        file.write(np.ascontiguousarray(targets, dtype='<i4').data)
+        file.write(bytes(-4 * edges % 8))
+        if weights is not None:
+            file.write(np.ascontiguousarray(weights, dtype='<f8').data)
+
+def load_csr(filename, mmap=True):
+    """(offsets, targets, weights) from a file written by save_csr; weights is None if absent.
+
+    With mmap the arrays are read-only views of the file, so loading costs
+    no more than opening it and pages are read as the graph is walked.
+    """
+    with open(filename, "rb") as file:
+        magic, vertices, edges, has_weights = HEADER.unpack(file.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError(f"{filename} is not a CSR graph file")
+
+    def read(dtype, count, offset):
+        if count == 0:
+            return np.zeros(0, dtype=dtype)
+        if mmap:
+            return np.memmap(filename, dtype=dtype, mode='r', offset=offset, shape=(count,))
+        return np.fromfile(filename, dtype=dtype, count=count, offset=offset)
+
+    offsets_at = HEADER.size
+    targets_at = offsets_at + 8 * (vertices + 1)
+    weights_at = targets_at + 4 * edges + (-4 * edges % 8)
+    offsets = read('<i8', vertices + 1, offsets_at)
+    targets = read('<i4', edges, targets_at)
+    weights = read('<f8', edges, weights_at) if has_weights else None
+    return offsets, targets, weights
+
+def save_graph(filename, graph, weights=None):
+    offsets, targets = graph.csr()
+    save_csr(filename, offsets, targets, weights)
+
+def load_graph(filename, mmap=True):
+    offsets, targets, _ = load_csr(filename, mmap)
+    return Graph.from_csr(offsets, targets)
+
+def load_or_generate(filename, generate, mmap=True):
+    """Load the graph saved at filename, or build it with generate() and save it there first."""
+    if not os.path.exists(filename):
+        save_graph(filename, generate())
+    return load_graph(filename, mmap)
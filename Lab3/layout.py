@@ -0,0 +1,71 @@
+import weakref
+import numpy as np
+
+SPRING_LIMIT = 200
+SPECTRAL_LIMIT = 1500
+
+# graph -> (V, E, positions); entries go away with the graph
+_layout_cache = weakref.WeakKeyDictionary()
+
+
+def circular_layout(n):
+    angles = 2 * np.pi * np.arange(n) / max(n, 1)
+    return np.column_stack((np.cos(angles), np.sin(angles)))
+
+def spectral_layout(n, sources, targets):
+    """Coordinates from the leading non-trivial eigenvectors of the normalised adjacency.
+
+    Edge direction is ignored.  Random sparse graphs are rarely connected,
+    and plain spectral layouts then collapse onto a few small components,
+    so the adjacency is regularised with a weak complete graph (weight
+    tau / n, tau = mean degree) before normalising (Qin and Rohe).
+    """
+    if n < 3:
+        return circular_layout(n)
+    adjacency = np.zeros((n, n))
+    adjacency[sources, targets] = 1
+    adjacency = np.maximum(adjacency, adjacency.T)
+    np.fill_diagonal(adjacency, 0)
+
+    tau = max(adjacency.sum() / n, 1.0)
+    adjacency += tau / n
+    scale = 1 / np.sqrt(adjacency.sum(axis=1))
+    _, vectors = np.linalg.eigh(adjacency * np.outer(scale, scale))
+    # The largest eigenvector is trivial (proportional to sqrt(degree)), take the next two
+    return normalize(vectors[:, -3:-1] * scale[:, None])
+
+def spring_layout(n, sources, targets, seed=42):
+    import networkx as nx
+
+    G = nx.DiGraph()
+    G.add_nodes_from(range(n))
+    G.add_edges_from(zip(sources.tolist(), targets.tolist()))
+    positions = nx.spring_layout(G, seed=seed)
+    return np.array([positions[v] for v in range(n)])
+
+def normalize(positions):
+    positions = positions - positions.mean(axis=0)
+    scale = np.abs(positions).max()
+    return positions / scale if scale else positions
+
+def graph_layout(graph):
+    """Positions (V x 2 array) for a Lab3 Graph, cached until the graph changes.
+
+    Spring layout for small graphs, spectral up to SPECTRAL_LIMIT vertices
+    (dense eigendecomposition, O(V^3)) and a circle beyond that.
+    """
+    offsets, targets = graph.csr()
+    cached = _layout_cache.get(graph)
+    if cached is not None and cached[0] == graph.V and cached[1] == len(targets):
+        return cached[2]
+
+    sources = np.repeat(np.arange(graph.V), np.diff(offsets))
+    if graph.V <= SPRING_LIMIT:
+        positions = spring_layout(graph.V, sources, targets)
+    elif graph.V <= SPECTRAL_LIMIT:
+        positions = spectral_layout(graph.V, sources, targets)
+    else:
+        positions = circular_layout(graph.V)
+
+    _layout_cache[graph] = (graph.V, len(targets), positions)
+    return positions
@@ -1,120 +1,85 @@
-import time
 import numpy as np
 import matplotlib.pyplot as plt
 import networkx as nx
-from collections import deque
-import random
+from matplotlib.collections import LineCollection
+from graph import Graph
+from layout import graph_layout
+from benchmark import TRAVERSALS, benchmark_traversals
+from components import component_sizes, strongly_connected_components, weakly_connected_components
 
-class Graph:
-    def __init__(self, vertices):
-        self.V = vertices
-        self.adj = [[] for _ in range(vertices)]
-    
-    def add_edge(self, v, w):
-        self.adj[v].append(w)
-    
-    def generate_random_graph(self, edge_probability=0.2):
-        for i in range(self.V):
-            for j in range(self.V):
-                if i != j and random.random() < edge_probability:
-                    self.add_edge(i, j)
-    
-    def dfs(self, start_vertex):
-        visited = [False] * self.V
-        path = []
-        start_time = time.time()
-        
-        def dfs_util(vertex):
-            visited[vertex] = True
-            path.append(vertex)
-            
-            for neighbor in self.adj[vertex]:
-                if not visited[neighbor]:
-                    dfs_util(neighbor)
-        
-        dfs_util(start_vertex)
-        end_time = time.time()
-        
-        return path, end_time - start_time
-    
-    def bfs(self, start_vertex):
-        visited = [False] * self.V
-        queue = deque([start_vertex])
-        visited[start_vertex] = True
-        path = []
-        
-        start_time = time.time()
-        
-        while queue:
-            vertex = queue.popleft()
-            path.append(vertex)
-            
-            for neighbor in self.adj[vertex]:
-                if not visited[neighbor]:
-                    visited[neighbor] = True
-                    queue.append(neighbor)
-        
-        end_time = time.time()
-        
-        return path, end_time - start_time
-
-def run_analysis(sizes):
-    dfs_times = []
-    bfs_times = []
+def run_analysis(sizes, graphs_per_size=3, repeats=5, warmup=1):
+    # Times are means over several random graphs (median of repeats each) with 95% CIs
+    traversals = {"DFS": TRAVERSALS["DFS"], "BFS": TRAVERSALS["BFS"]}
+    results = benchmark_traversals(sizes, graphs_per_size, repeats, warmup, traversals=traversals)
+    dfs_times = [row[1] for row in results["DFS"]]
+    bfs_times = [row[1] for row in results["BFS"]]
+    dfs_errors = [row[2] for row in results["DFS"]]
+    bfs_errors = [row[2] for row in results["BFS"]]
     dfs_vertices_visited = []
     bfs_vertices_visited = []
     
     for size in sizes:
         g = Graph(size)
-        g.generate_random_graph(edge_probability=2/size)
+        g.generate_random_graph(edge_probability=2/size, seed=0)
         
-        dfs_path, dfs_time = g.dfs(0)
-        bfs_path, bfs_time = g.bfs(0)
-        
-        dfs_times.append(dfs_time * 1000)  
-        bfs_times.append(bfs_time * 1000)  
-        
-        dfs_vertices_visited.append(len(dfs_path))
-        bfs_vertices_visited.append(len(bfs_path))
+        dfs_vertices_visited.append(len(g.dfs(0)[0]))
+        bfs_vertices_visited.append(len(g.bfs(0)[0]))
     
-    return dfs_times, bfs_times, dfs_vertices_visited, bfs_vertices_visited
+    return dfs_times, bfs_times, dfs_errors, bfs_errors, dfs_vertices_visited, bfs_vertices_visited
 
-def visualize_search_algorithm(graph, path, title):
-    G = nx.DiGraph()
-    
-    for v in range(graph.V):
-        G.add_node(v)
-    
-    for v in range(graph.V):
-        for w in graph.adj[v]:
-            G.add_edge(v, w)
-    
-    pos = nx.spring_layout(G, seed=42)
+def analyze_components(sizes):
+    # Why DFS/BFS from vertex 0 only reach part of a sparse random graph; seed 0
+    # rebuilds the same graphs run_analysis counted the visits on
+    stats = []
+    for size in sizes:
+        g = Graph(size)
+        g.generate_random_graph(edge_probability=2/size, seed=0)
+        scc_labels, scc_count = strongly_connected_components(g)
+        _, wcc_count = weakly_connected_components(g)
+        stats.append({
+            'size': size,
+            'reachable': len(g.bfs(0)[0]),
+            'scc_count': scc_count,
+            'largest_scc': int(component_sizes(scc_labels, scc_count).max()),
+            'wcc_count': wcc_count,
+        })
+    return stats
+
+def tree_edges(path, parents):
+    return {(int(parents[v]), v) for v in path[1:] if parents[v] >= 0}
+
+def visualize_search_algorithm(graph, path, title, parents, label_limit=50):
+    pos = graph_layout(graph)
+    traversed = tree_edges(path, parents)
+    offsets, targets = graph.csr()
+    sources = np.repeat(np.arange(graph.V), np.diff(offsets))
     
     plt.figure(figsize=(10, 6))
     
-    edge_colors = ['black' for _ in G.edges()]
-    node_colors = ['lightblue' for _ in G.nodes()]
-    
-    visited_edges = []
-    for i in range(len(path) - 1):
-        for j in range(i + 1, len(path)):
-            if path[j] in graph.adj[path[i]]:
-                visited_edges.append((path[i], path[j]))
-                break
-    
-    for i, (u, v) in enumerate(G.edges()):
-        if (u, v) in visited_edges:
-            edge_colors[i] = 'red'
-    
-    for i, node in enumerate(G.nodes()):
-        if node in path:
-            node_colors[i] = 'lightgreen'
-            if node == path[0]:
-                node_colors[i] = 'orange'
-    
-    nx.draw(G, pos, with_labels=True, node_color=node_colors, 
-            edge_color=edge_colors, arrows=True, node_size=500, font_size=10)
+    node_colors = np.array(['lightblue'] * graph.V, dtype=object)
+    node_colors[path] = 'lightgreen'
+    if path:
+        node_colors[path[0]] = 'orange'
+    
+    if graph.V <= label_limit:
+        G = nx.DiGraph()
+        G.add_nodes_from(range(graph.V))
+        G.add_edges_from(zip(sources.tolist(), targets.tolist()))
+        edge_colors = ['red' if edge in traversed else 'black' for edge in G.edges()]
+        nx.draw(G, dict(enumerate(pos)), with_labels=True, node_color=list(node_colors),
+                edge_color=edge_colors, arrows=True, node_size=500, font_size=10)
+    else:
+        # Large graphs: every edge in one LineCollection, vertices as a single scatter, no labels
+        ax = plt.gca()
+        ax.add_collection(LineCollection(np.stack((pos[sources], pos[targets]), axis=1),
+                                         colors='black', linewidths=0.2, alpha=0.3))
+        if traversed:
+            tree = np.array(sorted(traversed))
+            ax.add_collection(LineCollection(np.stack((pos[tree[:, 0]], pos[tree[:, 1]]), axis=1),
+                                             colors='red', linewidths=0.6))
+        ax.scatter(pos[:, 0], pos[:, 1], c=list(node_colors), s=max(2, 4000 / graph.V), zorder=3)
+        ax.set_aspect('equal')
+        ax.axis('off')
     
     plt.title(title)
     plt.tight_layout()
@@ -123,15 +88,15 @@ def visualize_search_algorithm(graph, path, title):
 
 def compare_algorithms():
     sizes = [10, 50, 100, 200, 300, 400, 500, 600, 700, 800, 900, 1000]
-    dfs_times, bfs_times, dfs_visits, bfs_visits = run_analysis(sizes)
+    dfs_times, bfs_times, dfs_errors, bfs_errors, dfs_visits, bfs_visits = run_analysis(sizes)
     
     plt.figure(figsize=(14, 6))
     
     plt.subplot(1, 2, 1)
-    plt.plot(sizes, dfs_times, 'o-', label='DFS')
-    plt.plot(sizes, bfs_times, 's-', label='BFS')
+    plt.errorbar(sizes, dfs_times, yerr=dfs_errors, fmt='o-', capsize=3, label='DFS')
+    plt.errorbar(sizes, bfs_times, yerr=bfs_errors, fmt='s-', capsize=3, label='BFS')
     plt.xlabel('Number of Vertices')
-    plt.ylabel('Execution Time (ms)')
+    plt.ylabel('Execution Time (ms, mean with 95% CI)')
     plt.title('Time Complexity Comparison')
     plt.legend()
     plt.grid(True)
@@ -152,11 +117,13 @@ def compare_algorithms():
     small_graph = Graph(8)
     small_graph.generate_random_graph(edge_probability=0.3)
     
-    dfs_path, _ = small_graph.dfs(0)
-    bfs_path, _ = small_graph.bfs(0)
+    dfs_parents = np.full(small_graph.V, -1, dtype=np.int32)
+    bfs_parents = np.full(small_graph.V, -1, dtype=np.int32)
+    dfs_path, _ = small_graph.dfs(0, parents=dfs_parents)
+    bfs_path, _ = small_graph.bfs(0, parents=bfs_parents)
     
-    visualize_search_algorithm(small_graph, dfs_path, "DFS Traversal")
-    visualize_search_algorithm(small_graph, bfs_path, "BFS Traversal")
+    visualize_search_algorithm(small_graph, dfs_path, "DFS Traversal", dfs_parents)
+    visualize_search_algorithm(small_graph, bfs_path, "BFS Traversal", bfs_parents)
     
     return dfs_times, bfs_times, dfs_visits, bfs_visits, sizes
 
@@ -184,6 +151,12 @@ def main():
         if dfs_visits[i] != bfs_visits[i]:
             print(f"For graph size {size}, DFS visited {dfs_visits[i]} vertices while BFS visited {bfs_visits[i]} vertices")
     
+    print("\nGraph Structure (edge probability 2/V):")
+    for stats in analyze_components(sizes):
+        print(f"V={stats['size']}: {stats['reachable']} reachable from 0, "
+              f"{stats['scc_count']} strongly connected components (largest {stats['largest_scc']}), "
+              f"{stats['wcc_count']} weakly connected components")
+
     print("\nVisualizations have been saved as 'dfs_traversal.png', 'bfs_traversal.png', and 'algorithm_comparison.png'")
 
 if __name__ == "__main__":
@@ -0,0 +1,155 @@
+import csv
+from array import array
+from collections import deque
+import numpy as np
+
+# Event kinds stored in TraversalTrace.kinds
+POP, VISIT, PUSH = 0, 1, 2
+EVENT_NAMES = ("pop", "visit", "push")
+
+
+class TraversalState:
+    """Stack/queue contents, visited set and path of a DFS or BFS at one step.
+
+    DFS marks a vertex visited when it is popped, BFS when it is pushed,
+    the same as the step-by-step visualizer.
+    """
+
+    def __init__(self, algorithm, start=0):
+        self.algorithm = algorithm
+        self.frontier = [start] if algorithm == "DFS" else deque([start])
+        self.in_frontier = {start: 1}  # vertex -> copies on the stack/queue
+        self.visited = set() if algorithm == "DFS" else {start}
+        self.path = []
+
+    @property
+    def current(self):
+        return self.path[-1] if self.path else None
+
+    def apply(self, kind, vertex):
+        if kind == POP:
+            if self.algorithm == "DFS":
+                self.frontier.pop()
+            else:
+                self.frontier.popleft()
+            self.in_frontier[vertex] -= 1
+        elif kind == VISIT:
+            self.visited.add(vertex)
+            self.path.append(vertex)
+        else:
+            self.frontier.append(vertex)
+            self.in_frontier[vertex] = self.in_frontier.get(vertex, 0) + 1
+            if self.algorithm == "BFS":
+                self.visited.add(vertex)
+
+
+class TraversalTrace:
+    """A whole DFS/BFS run as a compact event log with periodic snapshots.
+
+    Event i is (kinds[i], vertices[i]); the events of step s (1-based) are
+    kinds[step_offsets[s - 1]:step_offsets[s]].  Every snapshot_interval
+    steps the visited flags and frontier are saved, so state_at() rebuilds
+    any step by replaying at most snapshot_interval steps.
+    """
+
+    def __init__(self, algorithm, num_vertices, start=0, snapshot_interval=64):
+        self.algorithm = algorithm
+        self.num_vertices = num_vertices
+        self.start = start
+        self.snapshot_interval = snapshot_interval
+        self.kinds = array('b')
+        self.vertices = array('i')
+        self.step_offsets = array('i', [0])
+        self.visit_order = array('i')
+        self.snapshots = []  # (visited flags, frontier, path length) every snapshot_interval steps
+
+    def __len__(self):
+        return len(self.step_offsets) - 1
+
+    def events(self, step):
+        begin, end = self.step_offsets[step - 1], self.step_offsets[step]
+        return zip(self.kinds[begin:end], self.vertices[begin:end])
+
+    def snapshot(self, state):
+        flags = bytearray(self.num_vertices)
+        for vertex in state.visited:
+            flags[vertex] = 1
+        self.snapshots.append((bytes(flags), array('i', state.frontier), len(state.path)))
+
+    def state_at(self, step):
+        step = max(0, min(step, len(self)))
+        index = step // self.snapshot_interval
+        flags, frontier, path_length = self.snapshots[index]
+
+        state = TraversalState(self.algorithm, self.start)
+        state.visited = set(np.flatnonzero(np.frombuffer(flags, dtype=np.uint8)).tolist())
+        state.frontier = list(frontier) if self.algorithm == "DFS" else deque(frontier)
+        state.in_frontier = {}
+        for vertex in frontier:
+            state.in_frontier[vertex] = state.in_frontier.get(vertex, 0) + 1
+        state.path = self.visit_order[:path_length].tolist()
+
+        for replay in range(index * self.snapshot_interval + 1, step + 1):
+            for kind, vertex in self.events(replay):
+                state.apply(kind, vertex)
+        return state
+
+    def export(self, filename):
+        """Write the events as CSV (step, event, vertex) or, for .npz, the raw arrays."""
+        if filename.endswith(".npz"):
+            np.savez(filename, algorithm=self.algorithm, start=self.start,
+                     kinds=np.frombuffer(self.kinds, dtype=np.int8),
+                     vertices=np.frombuffer(self.vertices, dtype=np.int32),
+                     step_offsets=np.frombuffer(self.step_offsets, dtype=np.int32))
+            return
+        with open(filename, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["step", "event", "vertex"])
+            for step in range(1, len(self) + 1):
+                for kind, vertex in self.events(step):
+                    writer.writerow([step, EVENT_NAMES[kind], vertex])
+
+
+def record_traversal(adj_list, algorithm, start=0, snapshot_interval=64):
+    """Run DFS or BFS over adj_list (vertex -> neighbours) and record every step.
+
+    One step pops and visits one vertex and pushes its unvisited
+    neighbours in sorted order (reversed for DFS, so the smallest is
+    explored first); DFS then pops any stale copies left on the stack top.
+    """
+    trace = TraversalTrace(algorithm, len(adj_list), start, snapshot_interval)
+    state = TraversalState(algorithm, start)
+    trace.snapshot(state)
+
+    def emit(kind, vertex):
+        trace.kinds.append(kind)
+        trace.vertices.append(vertex)
+        if kind == VISIT:
+            trace.visit_order.append(vertex)
+        state.apply(kind, vertex)
+
+    while state.frontier:
+        if algorithm == "DFS":
+            current = state.frontier[-1]
+            emit(POP, current)
+            emit(VISIT, current)
+            for neighbor in sorted(adj_list[current], reverse=True):
+                if neighbor not in state.visited:
+                    emit(PUSH, neighbor)
+            # Stale copies of visited vertices left on top are dropped in this
+            # step, so the next one starts on an unvisited vertex
+            while state.frontier and state.frontier[-1] in state.visited:
+                emit(POP, state.frontier[-1])
+        else:
+            current = state.frontier[0]
+            emit(POP, current)
+            emit(VISIT, current)
+            for neighbor in sorted(adj_list[current]):
+                if neighbor not in state.visited:
+                    emit(PUSH, neighbor)
+
+        trace.step_offsets.append(len(trace.kinds))
+        if len(trace) % snapshot_interval == 0:
+            trace.snapshot(state)
+
+    return trace
@@ -1,9 +1,26 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import math
 import time
-from collections import deque
+from itertools import islice
+import heapq
 import random
+import numpy as np
+from graph import Graph, gnp_random_edges
+from layout import graph_layout
+from traversal_trace import VISIT, record_traversal
+
+# Above this many vertices the visualizer switches to large-graph mode
+LARGE_GRAPH_THRESHOLD = 40
+MAX_DRAWN_EDGES = 3000
+LABEL_ITEMS = 20
+
+def short_list(items, total):
+    # At most LABEL_ITEMS entries so the step labels stay readable on large graphs
+    text = ", ".join(map(str, items))
+    if total > len(items):
+        text += f", ... (+{total - len(items)} more)"
+    return f"[{text}]"
 
 class GraphVisualizer:
     def __init__(self, root):
@@ -16,17 +33,23 @@ class GraphVisualizer:
         self.edges = []
         self.adj_list = {}
         self.num_vertices = 8
+        self.large_mode = False
         
-        # Visualization state
-        self.visited = set()
-        self.current_vertex = None
-        self.stack = []  # For DFS
-        self.queue = deque()  # For BFS
-        self.path = []
+        # Visualization state: the recorded traversal and the state at step_count
+        self.trace = None
+        self.state = None
         self.step_count = 0
         self.is_running = False
         self.algorithm = "DFS"
         
+        # Retained canvas items and what changed since the last draw
+        self.vertex_items = {}  # vertex -> (oval id, text id)
+        self.edge_items = {}  # (min, max) vertex pair -> line id
+        self.vertex_colors = {}
+        self.traversed_edges = set()
+        self.dirty_vertices = set()
+        self.dirty_edges = set()
+        
         # Colors
         self.colors = {
             'unvisited': '#E8F4FD',
@@ -61,17 +84,24 @@ class GraphVisualizer:
         # Vertex count
         ttk.Label(control_frame, text="Vertices:").pack(side=tk.LEFT, padx=(20, 5))
         self.vertex_var = tk.IntVar(value=8)
-        vertex_spinner = tk.Spinbox(control_frame, from_=5, to=15, textvariable=self.vertex_var, 
+        vertex_spinner = tk.Spinbox(control_frame, from_=5, to=5000, textvariable=self.vertex_var, 
                                    width=5, command=self.on_vertex_count_change)
         vertex_spinner.pack(side=tk.LEFT, padx=5)
         
+        # Steps taken per auto-run tick, raised automatically for large graphs
+        ttk.Label(control_frame, text="Steps/tick:").pack(side=tk.LEFT, padx=(20, 5))
+        self.steps_var = tk.IntVar(value=1)
+        tk.Spinbox(control_frame, from_=1, to=500, textvariable=self.steps_var, width=4).pack(side=tk.LEFT, padx=5)
+        
         # Control buttons
         ttk.Button(control_frame, text="Generate New Graph", 
                   command=self.generate_random_graph).pack(side=tk.LEFT, padx=(20, 5))
         ttk.Button(control_frame, text="Reset", command=self.reset).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Step Back", command=self.step_back).pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="Step Forward", command=self.step_forward).pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="Auto Run", command=self.auto_run).pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="Stop", command=self.stop_auto_run).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Export Trace", command=self.export_trace).pack(side=tk.LEFT, padx=5)
         
         # Speed control
         ttk.Label(control_frame, text="Speed:").pack(side=tk.LEFT, padx=(20, 5))
@@ -80,6 +110,11 @@ class GraphVisualizer:
                                orient=tk.HORIZONTAL, length=100)
         speed_scale.pack(side=tk.LEFT, padx=5)
         
+        # Timeline over the recorded trace, drag to scrub backward and forward
+        self.timeline = tk.Scale(main_frame, from_=0, to=0, orient=tk.HORIZONTAL, showvalue=False,
+                                 command=self.on_scrub)
+        self.timeline.pack(side=tk.TOP, fill=tk.X, pady=(0, 10))
+        
         # Canvas frame
         canvas_frame = ttk.Frame(main_frame)
         canvas_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -132,107 +167,177 @@ class GraphVisualizer:
     
     def generate_random_graph(self):
         self.num_vertices = self.vertex_var.get()
-        self.vertices = []
+        self.large_mode = self.num_vertices > LARGE_GRAPH_THRESHOLD
         self.edges = []
-        self.adj_list = {i: [] for i in range(self.num_vertices)}
-        
-        # Position vertices in a circle
-        center_x, center_y = 350, 300
-        radius = min(250, 200)
-        
-        for i in range(self.num_vertices):
-            angle = 2 * math.pi * i / self.num_vertices
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-            self.vertices.append((x, y, i))
+        self.adj_list = {i: set() for i in range(self.num_vertices)}
         
         # Generate random edges (ensuring connectivity)
         # First, create a spanning tree to ensure connectivity
         for i in range(1, self.num_vertices):
             parent = random.randint(0, i - 1)
-            self.adj_list[parent].append(i)
-            self.adj_list[i].append(parent)
+            self.adj_list[parent].add(i)
+            self.adj_list[i].add(parent)
             self.edges.append((parent, i))
         
         # Add some random edges
-        edge_probability = 0.3
-        for i in range(self.num_vertices):
-            for j in range(i + 1, self.num_vertices):
-                if j not in self.adj_list[i] and random.random() < edge_probability:
-                    self.adj_list[i].append(j)
-                    self.adj_list[j].append(i)
-                    self.edges.append((i, j))
-        
+        if self.large_mode:
+            # About 3 extra neighbours per vertex, skip-sampled in O(V + E) instead of testing every pair
+            rng = np.random.default_rng(random.getrandbits(32))
+            sources, targets = gnp_random_edges(self.num_vertices, 3 / self.num_vertices, rng)
+            pairs = zip(sources.tolist(), targets.tolist())
+        else:
+            edge_probability = 0.3
+            pairs = ((i, j) for i in range(self.num_vertices) for j in range(i + 1, self.num_vertices)
+                     if random.random() < edge_probability)
+        for i, j in pairs:
+            if i < j and j not in self.adj_list[i]:
+                self.adj_list[i].add(j)
+                self.adj_list[j].add(i)
+                self.edges.append((i, j))
+        
+        self.vertices = self.vertex_positions()
+        if self.large_mode:
+            self.steps_var.set(max(1, self.num_vertices // 200))
+        self.create_canvas_items()
         self.reset()
-        self.draw_graph()
         self.update_info()
     
+    def vertex_positions(self):
+        center_x, center_y = 350, 300
+        if not self.large_mode:
+            # Position vertices in a circle
+            radius = min(250, 200)
+            return [(center_x + radius * math.cos(2 * math.pi * i / self.num_vertices),
+                     center_y + radius * math.sin(2 * math.pi * i / self.num_vertices), i)
+                    for i in range(self.num_vertices)]
+        
+        edges = np.array(self.edges, dtype=np.int32).reshape(-1, 2)
+        positions = graph_layout(Graph.from_edges(self.num_vertices, edges[:, 0], edges[:, 1]))
+        return [(center_x + 270 * x, center_y + 270 * y, i) for i, (x, y) in enumerate(positions.tolist())]
+    
+    def create_edge_item(self, i, j):
+        x1, y1, _ = self.vertices[i]
+        x2, y2, _ = self.vertices[j]
+        line = self.canvas.create_line(x1, y1, x2, y2, fill=self.colors['edge'], width=self.edge_width)
+        self.canvas.tag_lower(line)
+        self.edge_items[(min(i, j), max(i, j))] = line
+    
+    def create_canvas_items(self):
+        # Every line, circle and label is created once per graph and only recoloured afterwards
+        self.canvas.delete("all")
+        self.edge_items = {}
+        self.vertex_items = {}
+        self.vertex_colors = {}
+        # Edge state from the previous graph refers to lines that no longer exist
+        self.traversed_edges = set()
+        self.dirty_edges = set()
+        
+        if self.large_mode:
+            # Level of detail: small dots, no labels and a random sample of the edges;
+            # traversed edges outside the sample are added as they are reached
+            radius = max(2, min(8, int(200 / math.sqrt(self.num_vertices))))
+            outline = 1
+            self.edge_width = 1
+            drawn_edges = self.edges
+            if len(drawn_edges) > MAX_DRAWN_EDGES:
+                drawn_edges = random.sample(drawn_edges, MAX_DRAWN_EDGES)
+        else:
+            radius = 25
+            outline = 2
+            self.edge_width = 2
+            drawn_edges = self.edges
+        
+        for i, j in drawn_edges:
+            self.create_edge_item(i, j)
+        
+        for x, y, vertex_id in self.vertices:
+            oval = self.canvas.create_oval(x - radius, y - radius, x + radius, y + radius,
+                                           fill=self.colors['unvisited'], outline='black', width=outline)
+            text = None
+            if not self.large_mode:
+                text = self.canvas.create_text(x, y, text=str(vertex_id), font=('Arial', 12, 'bold'))
+            self.vertex_items[vertex_id] = (oval, text)
+            self.vertex_colors[vertex_id] = self.colors['unvisited']
+    
     def reset(self):
-        self.visited = set()
-        self.current_vertex = None
-        self.stack = []
-        self.queue = deque()
-        self.path = []
-        self.step_count = 0
+        self.dirty_vertices = set(self.vertex_items)
+        self.dirty_edges = set(self.traversed_edges)
+        self.traversed_edges = set()
         self.is_running = False
         self.algorithm = self.algorithm_var.get()
         
-        if self.algorithm == "DFS":
-            self.stack = [0]  # Start from vertex 0
-        else:
-            self.queue = deque([0])
-            self.visited.add(0)
+        # The whole traversal from vertex 0 is recorded up front, stepping replays it
+        self.trace = record_traversal(self.adj_list, self.algorithm)
+        self.state = self.trace.state_at(0)
+        self.step_count = 0
+        self.timeline.config(to=len(self.trace))
         
         self.draw_graph()
         self.update_labels()
         self.update_info()
     
+    def advance(self):
+        if self.step_count >= len(self.trace):
+            return False
+        
+        self.dirty_vertices.add(self.state.current)
+        self.step_count += 1
+        for kind, vertex in self.trace.events(self.step_count):
+            if kind == VISIT and self.state.path:
+                self.mark_traversed(self.state.path[-1], vertex)
+            self.state.apply(kind, vertex)
+            self.dirty_vertices.add(vertex)
+        
+        return self.step_count < len(self.trace)
+    
     def step_forward(self):
-        if self.algorithm == "DFS":
-            self.dfs_step()
-        else:
-            self.bfs_step()
+        has_more = self.advance()
         
         self.draw_graph()
         self.update_labels()
+        return has_more
     
-    def dfs_step(self):
-        if not self.stack:
-            return False
-        
-        current = self.stack.pop()
-        
-        if current not in self.visited:
-            self.visited.add(current)
-            self.current_vertex = current
-            self.path.append(current)
-            self.step_count += 1
-            
-            # Add unvisited neighbors to stack (in reverse order for left-to-right traversal)
-            neighbors = sorted(self.adj_list[current], reverse=True)
-            for neighbor in neighbors:
-                if neighbor not in self.visited:
-                    self.stack.append(neighbor)
-        
-        return len(self.stack) > 0 or len(self.visited) < self.num_vertices
+    def step_back(self):
+        self.stop_auto_run()
+        if self.step_count > 0:
+            self.seek(self.step_count - 1)
     
-    def bfs_step(self):
-        if not self.queue:
-            return False
-        
-        current = self.queue.popleft()
-        self.current_vertex = current
-        self.path.append(current)
-        self.step_count += 1
-        
-        # Add unvisited neighbors to queue
-        neighbors = sorted(self.adj_list[current])
-        for neighbor in neighbors:
-            if neighbor not in self.visited:
-                self.visited.add(neighbor)
-                self.queue.append(neighbor)
+    def seek(self, step):
+        # Rebuild the state from the nearest snapshot, then recolour whatever differs
+        self.state = self.trace.state_at(step)
+        self.step_count = step
+        
+        previous = self.traversed_edges
+        self.traversed_edges = set()
+        path = self.state.path
+        for i in range(1, len(path)):
+            self.mark_traversed(path[i - 1], path[i])
+        self.dirty_edges = previous ^ self.traversed_edges
+        self.dirty_vertices = set(self.vertex_items)
         
-        return len(self.queue) > 0
+        self.draw_graph()
+        self.update_labels()
+    
+    def on_scrub(self, value):
+        step = int(float(value))
+        if step != self.step_count:
+            self.stop_auto_run()
+            self.seek(step)
+    
+    def mark_traversed(self, previous, current):
+        # The edge between consecutive path vertices is the one drawn as traversed
+        if current in self.adj_list[previous]:
+            edge = (min(previous, current), max(previous, current))
+            if edge not in self.edge_items:
+                self.create_edge_item(*edge)
+            self.traversed_edges.add(edge)
+            self.dirty_edges.add(edge)
+    
+    def export_trace(self):
+        filename = filedialog.asksaveasfilename(defaultextension=".csv",
+                                                filetypes=[("CSV", "*.csv"), ("NumPy arrays", "*.npz")])
+        if filename:
+            self.trace.export(filename)
     
     def auto_run(self):
         if not self.is_running:
@@ -241,7 +346,13 @@ class GraphVisualizer:
     
     def run_step(self):
         if self.is_running:
-            has_more = self.step_forward()
+            # Several traversal steps per frame, then one redraw of what they changed
+            for _ in range(max(1, self.steps_var.get())):
+                has_more = self.advance()
+                if not has_more:
+                    break
+            self.draw_graph()
+            self.update_labels()
             if has_more:
                 delay = int(1000 / self.speed_var.get())
                 self.root.after(delay, self.run_step)
@@ -251,58 +362,50 @@ class GraphVisualizer:
     def stop_auto_run(self):
         self.is_running = False
     
+    def vertex_color(self, vertex_id):
+        if vertex_id == self.state.current:
+            return self.colors['current']
+        if vertex_id in self.state.visited:
+            return self.colors['visited']
+        if self.state.in_frontier.get(vertex_id):
+            return self.colors['in_stack']
+        return self.colors['unvisited']
+    
     def draw_graph(self):
-        self.canvas.delete("all")
-        
-        # Draw edges
-        for i, j in self.edges:
-            x1, y1, _ = self.vertices[i]
-            x2, y2, _ = self.vertices[j]
-            
-            color = self.colors['edge']
-            width = 2
-            
-            # Highlight traversed edges
-            if (i in self.path and j in self.path):
-                i_idx = self.path.index(i) if i in self.path else -1
-                j_idx = self.path.index(j) if j in self.path else -1
-                if i_idx != -1 and j_idx != -1 and abs(i_idx - j_idx) == 1:
-                    color = self.colors['traversed_edge']
-                    width = 3
-            
-            self.canvas.create_line(x1, y1, x2, y2, fill=color, width=width)
-        
-        # Draw vertices
-        for x, y, vertex_id in self.vertices:
-            # Determine vertex color
-            if vertex_id == self.current_vertex:
-                color = self.colors['current']
-            elif vertex_id in self.visited:
-                color = self.colors['visited']
-            elif (self.algorithm == "DFS" and vertex_id in self.stack) or \
-                 (self.algorithm == "BFS" and vertex_id in self.queue):
-                color = self.colors['in_stack']
+        # Only touch the items whose state changed since the last draw
+        for edge in self.dirty_edges:
+            if edge in self.traversed_edges:
+                self.canvas.itemconfig(self.edge_items[edge], fill=self.colors['traversed_edge'],
+                                       width=self.edge_width + 1)
             else:
-                color = self.colors['unvisited']
-            
-            # Draw vertex circle
-            radius = 25
-            self.canvas.create_oval(x - radius, y - radius, x + radius, y + radius,
-                                  fill=color, outline='black', width=2)
-            
-            # Draw vertex label
-            self.canvas.create_text(x, y, text=str(vertex_id), font=('Arial', 12, 'bold'))
+                self.canvas.itemconfig(self.edge_items[edge], fill=self.colors['edge'], width=self.edge_width)
+        
+        for vertex_id in self.dirty_vertices:
+            if vertex_id not in self.vertex_items:
+                continue
+            color = self.vertex_color(vertex_id)
+            if self.vertex_colors[vertex_id] != color:
+                self.vertex_colors[vertex_id] = color
+                self.canvas.itemconfig(self.vertex_items[vertex_id][0], fill=color)
+        
+        self.dirty_edges = set()
+        self.dirty_vertices = set()
     
     def update_labels(self):
         self.step_label.config(text=f"Step: {self.step_count}")
-        self.current_label.config(text=f"Current: {self.current_vertex}")
+        self.current_label.config(text=f"Current: {self.state.current}")
+        self.timeline.set(self.step_count)
         
+        frontier = self.state.frontier
         if self.algorithm == "DFS":
-            self.stack_queue_label.config(text=f"Stack: {list(reversed(self.stack))}")
+            top = list(islice(reversed(frontier), LABEL_ITEMS))
+            self.stack_queue_label.config(text=f"Stack: {short_list(top, len(frontier))}")
         else:
-            self.stack_queue_label.config(text=f"Queue: {list(self.queue)}")
+            front = list(islice(frontier, LABEL_ITEMS))
+            self.stack_queue_label.config(text=f"Queue: {short_list(front, len(frontier))}")
         
-        self.visited_label.config(text=f"Visited: {sorted(list(self.visited))}")
+        smallest = heapq.nsmallest(LABEL_ITEMS, self.state.visited)
+        self.visited_label.config(text=f"Visited: {short_list(smallest, len(self.state.visited))}")
     
     def update_info(self):
         self.info_text.delete(1.0, tk.END)
@@ -325,7 +428,7 @@ Characteristics:
 • Time complexity: O(V + E)
 • Good for: Finding paths, topological sorting
 
-Current path: """ + " → ".join(map(str, self.path))
+Current path: """ + " → ".join(map(str, self.state.path))
         else:
             info = """BREADTH-FIRST SEARCH (BFS)
 
@@ -344,7 +447,7 @@ Characteristics:
 • Time complexity: O(V + E)
 • Good for: Shortest paths, level-order traversal
 
-Current path: """ + " → ".join(map(str, self.path))
+Current path: """ + " → ".join(map(str, self.state.path))
         
         self.info_text.insert(1.0, info)
     
@@ -1,3 +1,4 @@
+import os
 import time
 import heapq
 import random
@@ -7,21 +8,90 @@ import networkx as nx
 from collections import defaultdict
 import pandas as pd
 import seaborn as sns
+from graph_io import load_csr, save_csr
 
 class Graph:
-    def __init__(self, vertices, is_dense=False, edge_probability=0.3):
+    def __init__(self, vertices, is_dense=False, edge_probability=0.3, storage="matrix"):
         self.V = vertices
         self.is_dense = is_dense
+        self.storage = storage
+        edge_prob = 0.7 if is_dense else edge_probability
+        if storage == "csr":
+            # Skip-sample the edges rather than testing all V^2 pairs, so large sparse graphs stay O(V + E)
+            rng = np.random.default_rng(random.getrandbits(32))
+            sources, targets = gnp_random_edges(vertices, edge_prob, rng)
+            self.offsets = np.zeros(vertices + 1, dtype=np.int64)
+            np.cumsum(np.bincount(sources, minlength=vertices), out=self.offsets[1:])
+            self.targets = targets
+            self.weights = rng.integers(1, 11, size=len(targets))
+            return
+        if storage != "matrix":
+            raise ValueError(f"Unknown storage: {storage}")
         self.graph = [[float('inf') for _ in range(vertices)] for _ in range(vertices)]
         for i in range(vertices):
             self.graph[i][i] = 0
-        edge_prob = 0.7 if is_dense else edge_probability
         for i in range(vertices):
             for j in range(vertices):
                 if i != j and random.random() < edge_prob:
                     self.graph[i][j] = random.randint(1, 10)
 
+    @classmethod
+    def from_csr(cls, offsets, targets, weights, is_dense=False, storage="csr"):
+        graph = cls.__new__(cls)
+        graph.V = len(offsets) - 1
+        graph.is_dense = is_dense
+        graph.storage = "csr"
+        if weights is None:
+            # Unweighted files, such as the Lab3 graphs, get unit edge weights
+            weights = np.ones(len(targets), dtype=np.int64)
+        # Keep integer weights as ints, as the random generator makes them
+        elif np.array_equal(weights, np.round(weights)):
+            weights = weights.astype(np.int64)
+        graph.offsets, graph.targets, graph.weights = offsets, targets, weights
+        if storage == "matrix":
+            graph.graph = graph.matrix()
+            graph.storage = "matrix"
+            del graph.offsets, graph.targets, graph.weights
+        elif storage != "csr":
+            raise ValueError(f"Unknown storage: {storage}")
+        return graph
+
+    def matrix(self):
+        # Adjacency matrix, built on demand from the CSR arrays in csr storage
+        if self.storage == "matrix":
+            return self.graph
+        matrix = [[float('inf')] * self.V for _ in range(self.V)]
+        offsets, targets, weights = np.asarray(self.offsets).tolist(), self.targets.tolist(), self.weights.tolist()
+        for i in range(self.V):
+            row = matrix[i]
+            row[i] = 0
+            for k in range(offsets[i], offsets[i + 1]):
+                row[targets[k]] = weights[k]
+        return matrix
+
+    def to_csr(self):
+        if self.storage == "csr":
+            return self.offsets, self.targets, self.weights
+        offsets, targets, weights = [0], [], []
+        for i, row in enumerate(self.graph):
+            for j, weight in enumerate(row):
+                if i != j and weight != float('inf'):
+                    targets.append(j)
+                    weights.append(weight)
+            offsets.append(len(targets))
+        return np.array(offsets, dtype=np.int64), np.array(targets, dtype=np.int32), np.array(weights, dtype=np.float64)
+
+    def save(self, filename):
+        save_csr(filename, *self.to_csr())
+
+    @classmethod
+    def load(cls, filename, is_dense=False, storage="csr"):
+        offsets, targets, weights = load_csr(filename)
+        return cls.from_csr(offsets, targets, weights, is_dense, storage)
+
     def dijkstra(self, start_vertex):
+        if self.storage == "csr":
+            return self.dijkstra_csr(start_vertex)
         start_time = time.time()
         distances = [float('inf')] * self.V
         distances[start_vertex] = 0
@@ -42,9 +112,32 @@ class Graph:
         execution_time = end_time - start_time
         return distances, execution_time
 
+    def dijkstra_csr(self, start_vertex):
+        # Walks only the real out-edges of each popped vertex: O((V + E) log V)
+        offsets, targets, weights = memoryview(self.offsets), memoryview(self.targets), memoryview(self.weights)
+        start_time = time.time()
+        distances = [float('inf')] * self.V
+        distances[start_vertex] = 0
+        priority_queue = [(0, start_vertex)]
+        visited = bytearray(self.V)
+        while priority_queue:
+            current_distance, current_vertex = heapq.heappop(priority_queue)
+            if visited[current_vertex]:
+                continue
+            visited[current_vertex] = 1
+            for k in range(offsets[current_vertex], offsets[current_vertex + 1]):
+                adj_vertex = targets[k]
+                distance = current_distance + weights[k]
+                if distance < distances[adj_vertex]:
+                    distances[adj_vertex] = distance
+                    heapq.heappush(priority_queue, (distance, adj_vertex))
+        end_time = time.time()
+        execution_time = end_time - start_time
+        return distances, execution_time
+
     def floyd_warshall(self):
         start_time = time.time()
-        dist = [row[:] for row in self.graph]
+        dist = [row[:] for row in self.matrix()]
         for k in range(self.V):
             for i in range(self.V):
                 for j in range(self.V):
@@ -54,19 +147,46 @@ class Graph:
         execution_time = end_time - start_time
         return dist, execution_time
 
+def gnp_random_edges(n, p, rng):
+    # Directed G(n, p) edges without self loops, sorted by source; the gaps between
+    # chosen pairs are geometric (Batagelj-Brandes skip sampling), so the cost is O(V + E)
+    total = n * (n - 1)
+    if total == 0 or p <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int32)
+    if p >= 1:
+        positions = np.arange(total, dtype=np.int64)
+    else:
+        expected = total * p
+        chunk = int(expected + 6 * expected ** 0.5) + 64
+        parts = []
+        last = -1
+        while True:
+            candidates = last + np.cumsum(rng.geometric(p, size=chunk))
+            inside = candidates[candidates < total]
+            parts.append(inside)
+            if len(inside) < chunk:
+                break
+            last = inside[-1]
+        positions = np.concatenate(parts)
+    sources = positions // (n - 1)
+    targets = positions % (n - 1)
+    targets += targets >= sources
+    return sources, targets.astype(np.int32)
+
 def visualize_graph(graph, algorithm="Both", sparse_or_dense=""):
+    matrix = graph.matrix()
     G = nx.DiGraph()
     for i in range(graph.V):
         G.add_node(i)
     for i in range(graph.V):
         for j in range(graph.V):
-            if i != j and graph.graph[i][j] != float('inf'):
-                G.add_edge(i, j, weight=graph.graph[i][j])
+            if i != j and matrix[i][j] != float('inf'):
+                G.add_edge(i, j, weight=matrix[i][j])
     plt.figure(figsize=(10, 8))
     pos = nx.spring_layout(G, seed=42)
     nx.draw_networkx_nodes(G, pos, node_size=500, node_color='lightblue')
     nx.draw_networkx_edges(G, pos, width=1.0, alpha=0.7, arrows=True)
-    edge_labels = {(i, j): graph.graph[i][j] for i in range(graph.V) for j in range(graph.V) if i != j and graph.graph[i][j] != float('inf')}
+    edge_labels = {(i, j): matrix[i][j] for i in range(graph.V) for j in range(graph.V) if i != j and matrix[i][j] != float('inf')}
     nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels)
     nx.draw_networkx_labels(G, pos)
     density_type = "Dense" if graph.is_dense else "Sparse"
@@ -77,14 +197,28 @@ def visualize_graph(graph, algorithm="Both", sparse_or_dense=""):
     plt.savefig(f"graph_{algorithm.lower()}_{density_type.lower()}_{graph.V}.png")
     plt.close()
 
-def compare_algorithms(vertex_range=range(10, 201, 20)):
+def cached_graph(cache_dir, vertices, is_dense=False, storage="matrix"):
+    # Generate each benchmark graph once, later runs load the identical graph from disk
+    filename = os.path.join(cache_dir, f"{'dense' if is_dense else 'sparse'}_{vertices}.csr")
+    if os.path.exists(filename):
+        return Graph.load(filename, is_dense, storage)
+    os.makedirs(cache_dir, exist_ok=True)
+    graph = Graph(vertices, is_dense=is_dense, storage=storage)
+    graph.save(filename)
+    return graph
+
+def compare_algorithms(vertex_range=range(10, 201, 20), cache_dir=None, storage="matrix"):
     dijkstra_sparse_times = []
     dijkstra_dense_times = []
     floyd_warshall_sparse_times = []
     floyd_warshall_dense_times = []
     for v in vertex_range:
-        sparse_graph = Graph(v, is_dense=False)
-        dense_graph = Graph(v, is_dense=True)
+        if cache_dir:
+            sparse_graph = cached_graph(cache_dir, v, is_dense=False, storage=storage)
+            dense_graph = cached_graph(cache_dir, v, is_dense=True, storage=storage)
+        else:
+            sparse_graph = Graph(v, is_dense=False, storage=storage)
+            dense_graph = Graph(v, is_dense=True, storage=storage)
         if v == vertex_range[0]:
             visualize_graph(sparse_graph, "Both", " (Sparse)")
             visualize_graph(dense_graph, "Both", " (Dense)")
@@ -224,6 +358,8 @@ def test_algorithm_correctness():
     ]
     dijkstra_distances, _ = g.dijkstra(0)
     print("Dijkstra's algorithm distances from vertex 0:", dijkstra_distances)
+    csr_distances, _ = Graph.from_csr(*g.to_csr()).dijkstra(0)
+    print("CSR storage Dijkstra matches:", csr_distances == dijkstra_distances)
     floyd_distances, _ = g.floyd_warshall()
     print("Floyd-Warshall algorithm all-pairs shortest paths:")
     for row in floyd_distances:
@@ -254,6 +390,26 @@ def optimize_sparse_graph_parameters():
     plt.savefig("edge_probability_analysis.png")
     plt.close()
 
+def analyze_sparse_dijkstra(vertex_counts=(10**3, 10**4, 10**5, 10**6), average_degree=4):
+    # Only CSR storage can hold these sizes; a V x V matrix at 10^6 vertices would need 10^12 entries
+    times = []
+    for v in vertex_counts:
+        graph = Graph(v, edge_probability=average_degree / v, storage="csr")
+        _, dijkstra_time = graph.dijkstra(0)
+        times.append(dijkstra_time)
+        print(f"V={v}, E={len(graph.targets)}: Dijkstra took {dijkstra_time:.3f} s")
+    plt.figure(figsize=(10, 6))
+    plt.loglog(list(vertex_counts), times, 'b-o', label='Dijkstra (CSR)')
+    plt.xlabel('Number of Vertices')
+    plt.ylabel('Execution Time (seconds)')
+    plt.title(f'Sparse Dijkstra, average out-degree {average_degree}')
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    plt.savefig("sparse_dijkstra.png")
+    plt.close()
+    return times
+
 def main():
     print("Testing algorithm correctness...")
     test_algorithm_correctness()
@@ -263,6 +419,8 @@ def main():
     analyze_complexity_vs_theory()
     print("\nOptimizing sparse graph parameters...")
     optimize_sparse_graph_parameters()
+    print("\nDijkstra on large sparse graphs (CSR storage)...")
+    analyze_sparse_dijkstra()
 
 if __name__ == "__main__":
     main()